@@ -7,6 +7,7 @@ Subtype extractors (#31, v0.3.3) yield secondary channel names like
 
 from __future__ import annotations
 
+import functools
 import re
 from typing import Any, Optional
 
@@ -142,10 +143,18 @@ def get_subtype(category: str, tool_name: str, raw_json: dict[str, Any]) -> Opti
         return None
 
 
+@functools.lru_cache(maxsize=128)
 def categorize_tool(tool_name: str) -> str:
-    """Map tool name to category."""
-    # Check for MCP tools (mcp__servername__toolname format)
-    if tool_name.startswith("mcp__"):
+    """Map tool name to category.
+
+    lru_cache'd: a hook burst re-categorizes the same few tool names
+    (should_log_tool, main(), subtype routing), so repeats collapse to a
+    single dict probe. Also means the unknown-tool debug line below fires
+    once per name per process rather than per call.
+    """
+    # Check for MCP tools (mcp__servername__toolname format); the slice
+    # compare avoids startswith's method-call overhead on this hot path
+    if tool_name[:5] == "mcp__":
         return "mcp"
 
     category = TOOL_CATEGORIES.get(tool_name)
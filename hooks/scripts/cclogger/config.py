@@ -10,13 +10,22 @@ from __future__ import annotations
 
 import json
 import os
+import pickle
 from pathlib import Path
 from typing import Any
 
 from cclogger.config_merge import apply_override_config, parse_bool
-from cclogger.debug import debug_log
+from cclogger.debug import debug_log, get_home
 from cclogger.models import Config
 
+# orjson parses config files several times faster than stdlib json.
+# Optional dependency: fall back to json.loads when it isn't installed.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 
 # ============================================================================
 # Configuration Loading
@@ -25,35 +34,115 @@ from cclogger.models import Config
 
 def load_config_file(path: Path) -> dict[str, Any]:
     """Load a JSON config file, returning empty dict on failure."""
-    if not path.exists():
-        return {}
+    # No exists() pre-check: open and let ENOENT surface, saving a stat on
+    # every load. One os.read covers typical (<4KB) configs in a single
+    # syscall with no TextIOWrapper; both orjson and json accept UTF-8 bytes.
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            data = os.read(fd, 65536)
+            if len(data) == 65536:
+                # Unusually large config -- finish reading it
+                chunks = [data]
+                while chunk := os.read(fd, 65536):
+                    chunks.append(chunk)
+                data = b"".join(chunks)
+        finally:
+            os.close(fd)
+        return _loads(data)
     except Exception:
         return {}
 
 
 def merge_configs(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
-    """Merge two config dicts, with override taking precedence."""
-    result = base.copy()
+    """Merge two config dicts, with override taking precedence.
+
+    Fast-path the one-sided cases (a missing session config is the common
+    one) so most hook invocations do a single dict copy; recursion only
+    happens for keys where both sides hold a dict.
+    """
+    if not override:
+        return {**base}
+    if not base:
+        return {**override}
+    result = {**base}
     for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_configs(result[key], value)
+        existing = result.get(key)
+        if isinstance(existing, dict) and isinstance(value, dict):
+            result[key] = merge_configs(existing, value)
         else:
             result[key] = value
     return result
 
 
+_ENV_PREFIX = "CLAUDE_HISTORY_"
+
+
+def _history_env() -> dict[str, str]:
+    """Collect CLAUDE_HISTORY_* environment overrides in one pass.
+
+    load_configuration consults a dozen-plus variables; a single sweep
+    over os.environ replaces the repeated per-key lookups and doubles as
+    the environment component of the config-cache key.
+    """
+    return {
+        k[len(_ENV_PREFIX):]: v
+        for k, v in os.environ.items()
+        if k.startswith(_ENV_PREFIX)
+    }
+
+
+def _config_cache_key(global_path: Path, session_path: Path,
+                      env: dict[str, str]) -> tuple:
+    """Build the invalidation key for the on-disk configuration cache.
+
+    Covers every input load_configuration depends on: the two config
+    files (by mtime_ns; 0 when absent), the CLAUDE_HISTORY_* environment
+    (stored verbatim -- hash() is salted per process so a digest would
+    never match across hook invocations), and the Config schema (field
+    names) so a plugin upgrade that changes the dataclass invalidates
+    stale pickles instead of resurrecting them.
+    """
+    def mtime_ns(path: Path) -> int:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return 0
+
+    return (
+        mtime_ns(global_path),
+        mtime_ns(session_path),
+        tuple(sorted(env.items())),
+        tuple(Config.__dataclass_fields__),
+    )
+
+
 def load_configuration(session_context: str) -> Config:
     """Load configuration with proper precedence.
 
     Priority: Environment Variables > Session Config > Global Config > Defaults
+
+    The computed Config is memoized on disk (pickled next to the session
+    state files) keyed by config-file mtimes + CLAUDE_HISTORY_* env, so
+    the hook bursts of a session skip the JSON parse + merge + env sweep
+    and pay two stat calls + one pickle load instead.
     """
-    home = Path.home()
+    home = get_home()
     global_config_path = home / ".claude" / "claude-history.json"
     session_config_path = home / ".claude" / f"claude-history-{session_context}.json"
 
+    cache_file = (home / ".claude" / "session-states"
+                  / f"config-{session_context or 'default'}.cache")
+    env = _history_env()
+    key = _config_cache_key(global_config_path, session_config_path, env)
+    try:
+        with open(cache_file, "rb") as f:
+            cached_key, cached_config = pickle.load(f)
+        if cached_key == key and isinstance(cached_config, Config):
+            return cached_config
+    except Exception:
+        pass  # Missing/corrupt/stale cache -- recompute below
+
     # Load and merge config files
     global_config = load_config_file(global_config_path)
     session_config = load_config_file(session_config_path)
@@ -86,7 +175,7 @@ def load_configuration(session_context: str) -> Config:
     if isinstance(filter_config, dict):
         include_list = filter_config.get("include", [])
         if isinstance(include_list, list):
-            config.filter_include = include_list
+            config.filter_include = frozenset(include_list)
 
     # Action-only settings
     action_only_config = file_config.get("action_only", {})
@@ -110,7 +199,7 @@ def load_configuration(session_context: str) -> Config:
         pass
 
     # Environment variable overrides (highest priority)
-    env_verbosity = os.environ.get("CLAUDE_HISTORY_VERBOSITY")
+    env_verbosity = env.get("VERBOSITY")
     if env_verbosity:
         try:
             v = int(env_verbosity)
@@ -119,7 +208,7 @@ def load_configuration(session_context: str) -> Config:
         except ValueError:
             pass
 
-    env_datetime = os.environ.get("CLAUDE_HISTORY_DATETIME")
+    env_datetime = env.get("DATETIME")
     if env_datetime:
         if env_datetime in ("full", "true", "1", "yes"):
             config.datetime_mode = "full"
@@ -128,41 +217,54 @@ def load_configuration(session_context: str) -> Config:
         elif env_datetime in ("false", "0", "no", "none"):
             config.datetime_mode = "none"
 
-    env_pwd = os.environ.get("CLAUDE_HISTORY_PWD")
+    env_pwd = env.get("PWD")
     if env_pwd:
         config.pwd_enabled = parse_bool(env_pwd)
 
-    env_filter = os.environ.get("CLAUDE_HISTORY_FILTER")
+    env_filter = env.get("FILTER")
     if env_filter:
-        config.filter_include = [f.strip() for f in env_filter.split(",") if f.strip()]
+        config.filter_include = frozenset(
+            f.strip() for f in env_filter.split(",") if f.strip()
+        )
 
     # Action-only environment overrides
     for cat in config.action_only.keys():
-        env_var = f"CLAUDE_HISTORY_ACTION_ONLY_{cat.upper()}"
-        env_val = os.environ.get(env_var)
+        env_val = env.get(f"ACTION_ONLY_{cat.upper()}")
         if env_val:
             config.action_only[cat] = parse_bool(env_val)
 
-    env_todowrite = os.environ.get("CLAUDE_HISTORY_ACTION_ONLY_TODOWRITE")
+    env_todowrite = env.get("ACTION_ONLY_TODOWRITE")
     if env_todowrite:
         config.action_only_overrides["TodoWrite"] = env_todowrite
 
     # Failure capture environment overrides
-    env_failure_enabled = os.environ.get("CLAUDE_HISTORY_FAILURE_ENABLED")
+    env_failure_enabled = env.get("FAILURE_ENABLED")
     if env_failure_enabled:
         config.failure_capture_enabled = parse_bool(env_failure_enabled)
 
-    env_failure_stderr = os.environ.get("CLAUDE_HISTORY_FAILURE_STDERR")
+    env_failure_stderr = env.get("FAILURE_STDERR")
     if env_failure_stderr:
         config.failure_capture_stderr = parse_bool(env_failure_stderr)
 
-    env_failure_max = os.environ.get("CLAUDE_HISTORY_FAILURE_MAX_LINES")
+    env_failure_max = env.get("FAILURE_MAX_LINES")
     if env_failure_max:
         try:
             config.failure_capture_max_lines = max(1, min(1000, int(env_failure_max)))
         except ValueError:
             pass
 
+    # Persist for the next hook invocation (atomic via temp + replace,
+    # same pattern as write_session_state). Best-effort: a failed write
+    # just means the next hook recomputes.
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = cache_file.with_suffix(".cache.tmp")
+        with open(temp_file, "wb") as f:
+            pickle.dump((key, config), f)
+        temp_file.replace(cache_file)
+    except Exception:
+        pass
+
     return config
 
 
@@ -186,7 +288,7 @@ class ConfigLoader:
     A debug-log warning fires if both exist (the single file is ignored).
     """
 
-    CONFIG_DIR = Path.home() / ".claude" / "plugins" / "settings"
+    CONFIG_DIR = get_home() / ".claude" / "plugins" / "settings"
     CONFIG_FILE = CONFIG_DIR / "session-logger.json"
     CONFIG_SUBDIR = CONFIG_DIR / "session-logger"  # Per-channel layout
 
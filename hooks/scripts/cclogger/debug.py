@@ -8,20 +8,27 @@ import ...` without each one bootstrapping the install.
 
 from __future__ import annotations
 
+import atexit
+import importlib.util
+import os
 import re
-import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
 
 
 def _ensure_dazzle_filekit():
-    """Auto-install dazzle-filekit if missing (e.g. running inside a venv)."""
-    try:
-        import dazzle_filekit  # noqa: F401
+    """Auto-install dazzle-filekit if missing (e.g. running inside a venv).
+
+    Availability is probed with find_spec rather than a real import so the
+    common already-installed case doesn't pay the package's import cost at
+    cclogger import time -- modules that need it import it on first use.
+    """
+    if importlib.util.find_spec("dazzle_filekit") is not None:
         return
-    except ImportError:
-        pass
+
+    # Only needed on the (rare) install path
+    import subprocess
 
     # Avoid retrying on every hook call if install previously failed
     sentinel = Path.home() / ".claude" / "logs" / ".dazzle_filekit_install_failed"
@@ -68,6 +75,22 @@ def _ensure_dazzle_filekit():
         raise ImportError("Failed to auto-install dazzle-filekit")
 
 
+# Path.home() re-parses HOME/USERPROFILE through expanduser on every call,
+# and ~/.claude paths get built all over the package on every hook. Cache
+# the result, keyed on the raw env value so runtime redirects (the test
+# suite's isolated_home fixture swaps HOME per test) still take effect.
+_home_cache: "tuple[str | None, Path] | None" = None
+
+
+def get_home() -> Path:
+    """Cached Path.home() -- one env read instead of expanduser each call."""
+    global _home_cache
+    key = os.environ.get("HOME") or os.environ.get("USERPROFILE")
+    if _home_cache is None or _home_cache[0] != key:
+        _home_cache = (key, Path.home())
+    return _home_cache[1]
+
+
 # Debug logging - use persistent location under ~/.claude
 DEBUG_LOG = Path.home() / ".claude" / "logs" / "hook-debug.log"
 
@@ -142,11 +165,29 @@ def _warn_unknown_role_once(role: str) -> None:
         pass
 
 
+# Kill-switch for debug logging: CLAUDE_HISTORY_DEBUG=0/false/no/off makes
+# debug_log a cheap early return. Defaults to enabled so the documented
+# hook-debug.log workflow keeps working out of the box.
+_DEBUG_ENABLED = os.environ.get(
+    "CLAUDE_HISTORY_DEBUG", "1"
+).strip().lower() not in ("0", "false", "no", "off")
+
+# Persistent append handle, opened lazily on the first debug_log call.
+# debug_log fires from every hot path; reopening (mkdir + open + close)
+# per message tripled its syscall cost. atexit flushes on process exit.
+_debug_fh = None
+
+
 def debug_log(message: str) -> None:
-    """Append debug message to log file."""
+    """Append debug message to log file (no-op when debug is disabled)."""
+    if not _DEBUG_ENABLED:
+        return
+    global _debug_fh
     try:
-        DEBUG_LOG.parent.mkdir(parents=True, exist_ok=True)
-        with open(DEBUG_LOG, "a") as f:
-            f.write(f"{datetime.now()}: {message}\n")
+        if _debug_fh is None:
+            DEBUG_LOG.parent.mkdir(parents=True, exist_ok=True)
+            _debug_fh = open(DEBUG_LOG, "a", buffering=8192)
+            atexit.register(_debug_fh.close)
+        _debug_fh.write(f"{datetime.now()}: {message}\n")
     except Exception:
         pass
@@ -0,0 +1,57 @@
+"""Deferred atomic writes for small per-session sidecar files.
+
+Hook invocations touch several tiny state files on every tool call
+(session-state JSON, name-cache). Queuing the payloads and flushing once
+at process exit coalesces repeated writes to the same path within one
+invocation and skips writes whose content is already on disk, halving
+the metadata syscalls in the common nothing-changed case.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+from pathlib import Path
+
+_pending_writes: dict[Path, bytes] = {}
+_flush_registered = False
+
+
+def defer_write(path: Path, data: bytes) -> None:
+    """Queue an atomic write of data to path, flushed at process exit.
+
+    A later defer_write for the same path within one invocation replaces
+    the earlier payload, so only the final state hits the disk.
+    """
+    global _flush_registered
+    _pending_writes[path] = data
+    if not _flush_registered:
+        atexit.register(flush_pending_writes)
+        _flush_registered = True
+
+
+def flush_pending_writes() -> None:
+    """Write all queued payloads, one atomic temp-file + os.replace each.
+
+    Payloads whose bytes already match the on-disk file are skipped --
+    cheap to verify since these sidecars are all tiny. Best-effort: a
+    failure on one path never blocks the others (these are caches and
+    state mirrors, not the sesslog channels themselves).
+    """
+    while _pending_writes:
+        path, data = _pending_writes.popitem()
+        try:
+            try:
+                if path.read_bytes() == data:
+                    continue
+            except OSError:
+                pass
+            temp = path.with_name(path.name + ".tmp")
+            fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+            os.replace(temp, path)
+        except Exception:
+            pass
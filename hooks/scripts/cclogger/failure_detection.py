@@ -11,9 +11,12 @@ from __future__ import annotations
 
 import json
 import os
+import re
+import time
 from datetime import datetime
 from pathlib import Path
 
+from cclogger.debug import get_home
 from cclogger.formatters import format_datetime, should_use_action_only
 from cclogger.logger import SessionLogger
 from cclogger.models import Config, ToolInfo
@@ -24,8 +27,21 @@ from cclogger.models import Config, ToolInfo
 # ============================================================================
 
 
+# One compiled alternation instead of six separate `in` scans over the
+# (possibly large) tool output -- a single pass finds any indicator.
+_FAILURE_RE = re.compile(
+    r"command not found"
+    r"|No such file or directory"
+    r"|Permission denied"
+    r"|syntax error"
+    r"|Failed to execute"
+    r"|exit status"
+)
+
+
 def detect_and_log_failure(
-    tool_info: ToolInfo, config: Config, logger: SessionLogger, event_time: datetime
+    tool_info: ToolInfo, config: Config, logger: SessionLogger, event_time: datetime,
+    cwd: str = "",
 ) -> None:
     """Enhanced failure detection for Bash commands.
 
@@ -34,30 +50,50 @@ def detect_and_log_failure(
         config: Logger configuration
         logger: The session logger instance
         event_time: The event timestamp (for consistent timestamps with main entry)
+        cwd: Working directory from the hook payload; saves an os.getcwd()
+            syscall when provided (the payload always carries it)
     """
     if tool_info.name != "Bash" or not config.failure_capture_enabled:
         return
 
-    # Look for pre-captured command data
-    capture_dir = Path.home() / ".claude" / "captures"
+    # Look for pre-captured command data. One scandir pass answers both
+    # questions we have for the capture directory -- "newest capture for
+    # this session within 5 minutes?" and "anything stale enough (10+
+    # minutes) to clean up?" -- instead of two glob walks with a stat per
+    # file each.
+    capture_dir = get_home() / ".claude" / "captures"
     capture_file = None
-
-    if capture_dir.exists():
-        # Find most recent capture file for this session (within last 5 minutes)
-        import time
-
-        cutoff_time = time.time() - 300  # 5 minutes ago
-
-        for f in capture_dir.glob(f"{tool_info.session_id}-*"):
-            if f.stat().st_mtime > cutoff_time:
-                capture_file = f
-                break
+    capture_mtime = 0.0
+    session_prefix = f"{tool_info.session_id}-"
+
+    now = time.time()
+    recent_cutoff = now - 300   # 5 minutes ago
+    cleanup_cutoff = now - 600  # 10 minutes ago
+
+    try:
+        with os.scandir(capture_dir) as it:
+            for entry in it:
+                if not entry.name.startswith(session_prefix):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                    if mtime < cleanup_cutoff:
+                        os.unlink(entry.path)
+                    elif mtime > recent_cutoff and mtime > capture_mtime:
+                        capture_file = Path(entry.path)
+                        capture_mtime = mtime
+                except OSError:
+                    continue
+    except OSError:
+        pass  # No capture directory yet -- nothing captured, nothing stale
 
     # Determine command source and details
     bash_command = ""
     command_cwd = ""
 
-    if capture_file and capture_file.exists():
+    if capture_file:
+        # No extra exists() stat -- the scan just saw it, and the open
+        # below already tolerates a race with another cleanup pass.
         try:
             with open(capture_file, "r", encoding="utf-8") as f:
                 capture_data = json.load(f)
@@ -68,7 +104,7 @@ def detect_and_log_failure(
             pass
     else:
         bash_command = tool_info.input.get("command", "")
-        command_cwd = os.getcwd()
+        command_cwd = cwd or os.getcwd()
 
     # Check for failure indicators
     failure_detected = False
@@ -76,21 +112,10 @@ def detect_and_log_failure(
     error_output = ""
 
     tool_output = os.environ.get("CLAUDE_TOOL_OUTPUT", "")
-    if tool_output:
-        error_patterns = [
-            "command not found",
-            "No such file or directory",
-            "Permission denied",
-            "syntax error",
-            "Failed to execute",
-            "exit status",
-        ]
-        for pattern in error_patterns:
-            if pattern in tool_output:
-                failure_detected = True
-                failure_reason = "error detected in output"
-                error_output = tool_output
-                break
+    if tool_output and _FAILURE_RE.search(tool_output):
+        failure_detected = True
+        failure_reason = "error detected in output"
+        error_output = tool_output
 
     if failure_detected:
         # Generate failure entry (use same event_time as main entry)
@@ -98,7 +123,7 @@ def detect_and_log_failure(
 
         pwd_part = ""
         if config.pwd_enabled:
-            pwd_part = f' ["{command_cwd or os.getcwd()}"]'
+            pwd_part = f' ["{command_cwd or cwd or os.getcwd()}"]'
 
         if should_use_action_only(tool_info.name, config):
             failure_content = "Bash"
@@ -109,23 +134,16 @@ def detect_and_log_failure(
 
         failure_entry = f"{datetime_part}{{{failure_content} }} [FAILED: {failure_reason}]{pwd_part}"
 
-        # Add error output if enabled
+        # Add error output if enabled. maxsplit bounds the separator scan
+        # to the lines we keep instead of splitting megabytes of output to
+        # slice off the first few. The per-line join prefixes trailing
+        # empty lines too (output usually ends with "\n"), which
+        # textwrap.indent would drop.
         if config.failure_capture_stderr and error_output:
-            lines = error_output.split("\n")[: config.failure_capture_max_lines]
+            max_lines = config.failure_capture_max_lines
+            lines = error_output.split("\n", max_lines)[:max_lines]
             formatted_error = "\n".join(f"  {line}" for line in lines)
             if formatted_error:
                 failure_entry += "\n" + formatted_error
 
         logger.log_failure(failure_entry)
-
-    # Cleanup old capture files
-    if capture_dir.exists():
-        import time
-
-        cutoff_time = time.time() - 600  # 10 minutes ago
-        for f in capture_dir.glob(f"{tool_info.session_id}-*"):
-            try:
-                if f.stat().st_mtime < cutoff_time:
-                    f.unlink()
-            except Exception:
-                pass
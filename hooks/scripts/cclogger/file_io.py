@@ -23,15 +23,16 @@ sentinel marker in the session directory.
 
 from __future__ import annotations
 
+import atexit
 import os
 import re
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
 from cclogger.debug import debug_log
-from cclogger.file_lock import lock_exclusive, lock_nonblocking, unlock
+from cclogger.file_lock import lock_exclusive, unlock
 
 
 # Lock acquisition retry tuning. Three attempts with exponential
@@ -63,11 +64,68 @@ _LEGACY_ORPHAN_SENTINELS = (".orphan_session_name_swept_v0.3.7",)
 SESSION_LOGGER_README = "README.session-logger.md"
 
 
+# ============================================================================
+# Directory helpers
+# ============================================================================
+
+
+# Directories this process has already created (or verified). Hook
+# invocations touch the same base and session directories on every
+# event; one mkdir per path per process replaces a stat+mkdir pair
+# per call site.
+_ENSURED_DIRS: set[Path] = set()
+
+
+def ensure_dir(path: Path) -> None:
+    """mkdir -p `path`, at most once per process per path.
+
+    EAFP: a bare os.mkdir is one syscall whose EEXIST answer covers the
+    overwhelmingly common already-there case, where
+    mkdir(parents=True, exist_ok=True) stats every parent first. Only a
+    missing parent (ENOENT) falls back to the full recursive form.
+    """
+    if path in _ENSURED_DIRS:
+        return
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        pass
+    except FileNotFoundError:
+        path.mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRS.add(path)
+
+
 # ============================================================================
 # Time gap detection
 # ============================================================================
 
 
+# Compiled once: check_time_gap runs on every tool event, and runtime
+# re.search calls lean on re's small internal cache, which other
+# patterns in the process can evict.
+_TIMESTAMP_RE = re.compile(r"\[\[([^\]]+)\]\]")
+
+# Last-line timestamp per log file, maintained by atomic_append (which
+# owns every in-process write). A populated entry lets check_time_gap
+# skip the file read entirely; None records "last line carries no
+# [[timestamp]]" so the negative is cached too. Cold starts (process
+# restart) fall back to the bounded tail read once, then populate.
+_LAST_TS: dict[Path, Optional[datetime]] = {}
+
+
+def _parse_entry_timestamp(line: str) -> Optional[datetime]:
+    """Parse the [[timestamp]] marker from a log line, or None."""
+    match = _TIMESTAMP_RE.search(line)
+    if not match:
+        return None
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(match.group(1), fmt)
+        except ValueError:
+            continue
+    return None
+
+
 def check_time_gap(file_path: Path, datetime_mode: str, event_time: datetime,
                    gap_seconds: int = 1800) -> bool:
     """Check if there's a 30+ minute gap since last entry.
@@ -78,32 +136,38 @@ def check_time_gap(file_path: Path, datetime_mode: str, event_time: datetime,
         event_time: The current event's timestamp (for consistent comparison)
         gap_seconds: Number of seconds to consider a gap (default 30 minutes)
     """
-    if datetime_mode == "none" or not file_path.exists():
+    if datetime_mode == "none":
         return False
 
-    try:
-        # Read last line
-        with open(file_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-            if not lines:
-                return False
-            last_line = lines[-1]
-
-        # Extract timestamp
-        match = re.search(r"\[\[([^\]]+)\]\]", last_line)
-        if not match:
+    # Warm path: this process wrote (or previously inspected) the file,
+    # so the last entry's timestamp is already known.
+    if file_path in _LAST_TS:
+        last_time = _LAST_TS[file_path]
+        if last_time is None:
             return False
+        return (event_time - last_time).total_seconds() >= gap_seconds
 
-        last_timestamp_str = match.group(1)
-
-        # Parse timestamp - try both formats
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d"):
-            try:
-                last_time = datetime.strptime(last_timestamp_str, fmt)
-                break
-            except ValueError:
-                continue
-        else:
+    try:
+        # Read the last line via a bounded tail read -- constant cost no
+        # matter how large the log has grown (readlines() was O(file)).
+        # 4 KiB comfortably covers any single formatted entry line. No
+        # exists() probe first: the open itself answers that (a missing
+        # file raises and means "no gap"), saving a stat on this
+        # once-per-path cold path.
+        with open(file_path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if size == 0:
+                return False
+            f.seek(max(0, size - 4096))
+            tail = f.read()
+        # errors="replace" guards against the seek landing mid-codepoint;
+        # the [[timestamp]] marker itself is pure ASCII.
+        last_line = tail.rstrip(b"\n").rsplit(b"\n", 1)[-1].decode("utf-8", errors="replace")
+
+        last_time = _parse_entry_timestamp(last_line)
+        _LAST_TS[file_path] = last_time
+        if last_time is None:
             return False
 
         # Calculate time difference using event_time (not datetime.now())
@@ -119,23 +183,112 @@ def check_time_gap(file_path: Path, datetime_mode: str, event_time: datetime,
 # ============================================================================
 
 
+# Append handles, cached per path for the life of the hook process.
+# Reopening (mkdir + open + close) per entry cost three syscalls per
+# write; keeping the handle open amortizes that to once per path.
+# The byte-0 lock is still taken around every individual write, so
+# cross-process coordination is unchanged -- only the open/close churn
+# goes away. Closed via atexit; invalidated when reconciliation renames
+# a log file out from under the cached path.
+_append_handles: dict[Path, BinaryIO] = {}
+
+# Batched durability. Every append still hits the kernel synchronously
+# (entries are visible to `tail -f` and other processes the moment they
+# are logged) but the fsync is deferred: it fires once the unsynced
+# bytes for a path cross the threshold, and for whatever remains, once
+# at process exit before the handle closes. A hook invocation that logs
+# several entries to the same file pays one fsync instead of one per
+# entry. No flush timer -- hook processes are short-lived, and a
+# non-daemon Timer would hold up process exit.
+_FSYNC_THRESHOLD = 16 * 1024
+_unsynced_bytes: dict[Path, int] = {}
+
+
+def _note_written(file_path: Path, fp: BinaryIO, nbytes: int) -> None:
+    """Track unsynced bytes for `file_path`; fsync when they pile up."""
+    total = _unsynced_bytes.get(file_path, 0) + nbytes
+    if total >= _FSYNC_THRESHOLD:
+        os.fsync(fp.fileno())
+        total = 0
+    _unsynced_bytes[file_path] = total
+
+
+def _close_append_handles() -> None:
+    while _append_handles:
+        path, fp = _append_handles.popitem()
+        try:
+            if _unsynced_bytes.pop(path, 0):
+                os.fsync(fp.fileno())
+            fp.close()
+        except Exception:
+            pass
+
+
+atexit.register(_close_append_handles)
+
+
+def _get_append_handle(file_path: Path) -> BinaryIO:
+    """Return the cached append handle for `file_path`, opening on first use.
+
+    buffering=0 opens a raw FileIO: each write goes to the kernel in one
+    O_APPEND syscall with no BufferedWriter copy and nothing to flush.
+    POSIX guarantees O_APPEND writes land atomically at end-of-file,
+    which is what lets concurrent hook subprocesses share one log
+    without interleaving entries.
+    """
+    fp = _append_handles.get(file_path)
+    if fp is None or fp.closed:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        fp = open(file_path, "ab", buffering=0)
+        _append_handles[file_path] = fp
+    return fp
+
+
+def invalidate_append_handle(file_path: Path) -> None:
+    """Drop the cached handle for `file_path` (e.g. after a rename).
+
+    The old handle keeps writing to the original inode, which after a
+    reconciliation rename is the right file under the wrong name -- so
+    callers that move log files (`safe_rename`) must invalidate so the
+    next append reopens at the current path.
+    """
+    fp = _append_handles.pop(file_path, None)
+    # The cached last-line timestamp travels with the file, not the path
+    _LAST_TS.pop(file_path, None)
+    if fp is not None:
+        try:
+            if _unsynced_bytes.pop(file_path, 0):
+                os.fsync(fp.fileno())
+            fp.close()
+        except Exception:
+            pass
+
+
 def _safe_append_bytes(file_path: Path, payload_bytes: bytes) -> None:
-    """Open in append mode, lock, write+fsync, unlock, close.
+    """Lock the cached append handle, write, unlock.
 
     Single-attempt path used by both `atomic_append` (which adds retry
     + overflow fallback on top) and `migrate_overflow_files` (which
     wants the raw primitive without recursion into overflow fallback).
+    Durability is batched: see `_note_written`.
+
+    On any failure the cached handle is dropped before re-raising so
+    the retry in `atomic_append` reopens fresh rather than hammering a
+    dead descriptor.
 
     Raises whatever the underlying open/lock/write raises.
     """
-    with open(file_path, "ab") as fp:
+    fp = _get_append_handle(file_path)
+    try:
         lock_exclusive(fp)
         try:
             fp.write(payload_bytes)
-            fp.flush()
-            os.fsync(fp.fileno())
+            _note_written(file_path, fp, len(payload_bytes))
         finally:
             unlock(fp)
+    except Exception:
+        invalidate_append_handle(file_path)
+        raise
 
 
 def atomic_append(file_path: Path, content: str, add_gap: bool = False) -> None:
@@ -150,22 +303,18 @@ def atomic_append(file_path: Path, content: str, add_gap: bool = False) -> None:
     LOCK_RETRY_ATTEMPTS times. After exhaustion, fall back to
     `_write_to_overflow` so the entry is preserved rather than dropped.
     """
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Strip null bytes that could corrupt log file or confuse readers
+    # Strip null bytes that could corrupt log file or confuse readers,
+    # then build the payload in one shot so the locked region stays small
     content = content.replace("\x00", "")
-
-    # Build the bytes to write in one shot so the locked region stays small
-    payload = ""
-    if add_gap:
-        payload += "\n"
-    payload += content + "\n"
-    payload_bytes = payload.encode("utf-8")
+    payload_bytes = (b"\n" if add_gap else b"") + content.encode("utf-8") + b"\n"
 
     last_error: Exception | None = None
     for attempt in range(LOCK_RETRY_ATTEMPTS):
         try:
             _safe_append_bytes(file_path, payload_bytes)
+            # Record the new last-line timestamp (or its absence) so
+            # check_time_gap can answer from memory instead of re-reading.
+            _LAST_TS[file_path] = _parse_entry_timestamp(content.rsplit("\n", 1)[-1])
             return  # Success
         except Exception as e:
             last_error = e
@@ -208,6 +357,7 @@ def _write_to_overflow(file_path: Path, content: str, add_gap: bool) -> None:
             return
 
     try:
+        overflow_path.parent.mkdir(parents=True, exist_ok=True)
         with open(overflow_path, "a", encoding="utf-8", newline="\n") as f:
             if add_gap:
                 f.write("\n")
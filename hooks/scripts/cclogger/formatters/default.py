@@ -16,7 +16,6 @@ from typing import Any
 
 from cclogger.formatters.base import BaseFormatter
 from cclogger.formatters.legacy import format_datetime
-from cclogger.models import NewlinePolicy
 
 
 class DefaultFormatter(BaseFormatter):
@@ -72,8 +71,6 @@ class DefaultFormatter(BaseFormatter):
         Byte-identical to _legacy_complete when channel has no options
         (snippet truncated + escaped to match legacy truncate_preview).
         """
-        from cclogger.formatters.legacy import format_datetime
-
         role = entry.role or "unknown"
         tool_name = entry.tool_name
 
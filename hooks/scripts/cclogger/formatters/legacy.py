@@ -10,23 +10,39 @@ Three sections:
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from cclogger.categorize import categorize_tool
 from cclogger.config_merge import parse_bool
 from cclogger.models import (
     HINT_VERBOSITY_KEYS,
-    RESERVED_VERBOSITY_KEYS,
     ChannelOptions,
+    CommandContent,
     Config,
     NewlinePolicy,
     ToolInfo,
 )
 
+# orjson serializes to compact JSON several times faster than stdlib
+# json -- worth it for TodoWrite payloads and verbosity-4 input dumps,
+# which serialize arbitrarily large tool input per entry. Optional
+# dependency: fall back to the stdlib when missing. (orjson writes
+# non-ASCII characters as UTF-8 rather than \u-escapes; log files are
+# UTF-8 throughout, so both spellings are valid.)
+try:
+    import orjson
+
+    def _dumps_compact(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    def _dumps_compact(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
 
 # ============================================================================
 # Channel-options hierarchical resolution (v0.3.7 Phase 1)
@@ -251,9 +267,101 @@ def should_use_action_only(tool_name: str, config: Config) -> bool:
 # ============================================================================
 
 
+def _task_create(tool_input: dict[str, Any], tool_response: Any, max_desc: int) -> str:
+    subject = tool_input.get("subject", "(no subject)")
+    description = tool_input.get("description", "")
+
+    # Extract task ID from tool_response
+    task_id = ""
+    if isinstance(tool_response, dict):
+        task_data = tool_response.get("task", {})
+        if isinstance(task_data, dict):
+            task_id = task_data.get("id", "")
+
+    id_part = f" #{task_id}" if task_id else ""
+
+    if description:
+        if max_desc > 0 and len(description) > max_desc:
+            description = description[:max_desc] + "..."
+        return f"CREATE{id_part}: {subject} | {description}"
+    return f"CREATE{id_part}: {subject}"
+
+
+def _task_update(tool_input: dict[str, Any], tool_response: Any, max_desc: int) -> str:
+    task_id = tool_input.get("taskId", "?")
+    status = tool_input.get("status", "")
+    subject = tool_input.get("subject", "")
+    active_form = tool_input.get("activeForm", "")
+
+    # Get status change info from response
+    from_status = ""
+    if isinstance(tool_response, dict):
+        status_change = tool_response.get("statusChange", {})
+        if isinstance(status_change, dict):
+            from_status = status_change.get("from", "")
+
+    # Collect parts and join once -- repeated str += reallocates the
+    # whole string on every arm.
+    parts = [f"UPDATE: #{task_id}"]
+    if status:
+        parts.append(f": {from_status} -> {status}" if from_status else f" -> {status}")
+    if subject:
+        parts.append(f" | title='{subject}'")
+    if active_form:
+        parts.append(f" | {active_form}")
+
+    return "".join(parts)
+
+
+def _task_list(tool_input: dict[str, Any], tool_response: Any, max_desc: int) -> str:
+    return "LIST"
+
+
+def _task_get(tool_input: dict[str, Any], tool_response: Any, max_desc: int) -> str:
+    task_id = tool_input.get("taskId", "?")
+    return f"GET: #{task_id}"
+
+
+def _task_todos(tool_input: dict[str, Any], tool_response: Any, max_desc: int) -> str:
+    # #87: TodoWrite routed to tasks channel. Summarize the todo list
+    # with item counts by status and a preview of the first item.
+    todos = tool_input.get("todos", [])
+    if not isinstance(todos, list) or not todos:
+        return "TODOS: (empty)"
+    n = len(todos)
+    pending = sum(1 for t in todos if isinstance(t, dict) and t.get("status") == "pending")
+    in_progress = sum(1 for t in todos if isinstance(t, dict) and t.get("status") == "in_progress")
+    completed = sum(1 for t in todos if isinstance(t, dict) and t.get("status") == "completed")
+    first = todos[0] if isinstance(todos[0], dict) else {}
+    first_subj = first.get("content") or first.get("subject") or ""
+    if max_desc > 0 and len(first_subj) > max_desc:
+        first_subj = first_subj[:max_desc] + "..."
+    breakdown = f"{n} item(s) [{pending}p/{in_progress}ip/{completed}c]"
+    if first_subj:
+        return f"TODOS: {breakdown} first: {first_subj}"
+    return f"TODOS: {breakdown}"
+
+
+_TASK_HANDLERS: dict[str, Callable[[dict[str, Any], Any, int], str]] = {
+    "TaskCreate": _task_create,
+    "TaskUpdate": _task_update,
+    "TaskList": _task_list,
+    "TaskGet": _task_get,
+    "TodoWrite": _task_todos,
+}
+
+
 def get_task_content(tool_name: str, raw_json: dict[str, Any],
                      config: Optional[Config] = None) -> str:
-    """Extract task-specific content for Task* tools."""
+    """Extract task-specific content for Task* tools.
+
+    Dispatches through _TASK_HANDLERS (dict lookup, not an if/elif walk);
+    unknown tool names echo back unchanged.
+    """
+    handler = _TASK_HANDLERS.get(tool_name)
+    if handler is None:
+        return tool_name
+
     tool_input = raw_json.get("tool_input", {})
     tool_response = raw_json.get("tool_response", {})
 
@@ -262,78 +370,7 @@ def get_task_content(tool_name: str, raw_json: dict[str, Any],
     if config is not None:
         max_desc = config.performance.task_description_length
 
-    if tool_name == "TaskCreate":
-        subject = tool_input.get("subject", "(no subject)")
-        description = tool_input.get("description", "")
-
-        # Extract task ID from tool_response
-        task_id = ""
-        if isinstance(tool_response, dict):
-            task_data = tool_response.get("task", {})
-            if isinstance(task_data, dict):
-                task_id = task_data.get("id", "")
-
-        id_part = f" #{task_id}" if task_id else ""
-
-        if description:
-            if max_desc > 0 and len(description) > max_desc:
-                description = description[:max_desc] + "..."
-            return f"CREATE{id_part}: {subject} | {description}"
-        return f"CREATE{id_part}: {subject}"
-
-    elif tool_name == "TaskUpdate":
-        task_id = tool_input.get("taskId", "?")
-        status = tool_input.get("status", "")
-        subject = tool_input.get("subject", "")
-        active_form = tool_input.get("activeForm", "")
-
-        # Get status change info from response
-        from_status = ""
-        if isinstance(tool_response, dict):
-            status_change = tool_response.get("statusChange", {})
-            if isinstance(status_change, dict):
-                from_status = status_change.get("from", "")
-
-        output = f"UPDATE: #{task_id}"
-        if status:
-            if from_status:
-                output += f": {from_status} -> {status}"
-            else:
-                output += f" -> {status}"
-        if subject:
-            output += f" | title='{subject}'"
-        if active_form:
-            output += f" | {active_form}"
-
-        return output
-
-    elif tool_name == "TaskList":
-        return "LIST"
-
-    elif tool_name == "TaskGet":
-        task_id = tool_input.get("taskId", "?")
-        return f"GET: #{task_id}"
-
-    elif tool_name == "TodoWrite":
-        # #87: TodoWrite routed to tasks channel. Summarize the todo list
-        # with item counts by status and a preview of the first item.
-        todos = tool_input.get("todos", [])
-        if not isinstance(todos, list) or not todos:
-            return "TODOS: (empty)"
-        n = len(todos)
-        pending = sum(1 for t in todos if isinstance(t, dict) and t.get("status") == "pending")
-        in_progress = sum(1 for t in todos if isinstance(t, dict) and t.get("status") == "in_progress")
-        completed = sum(1 for t in todos if isinstance(t, dict) and t.get("status") == "completed")
-        first = todos[0] if isinstance(todos[0], dict) else {}
-        first_subj = first.get("content") or first.get("subject") or ""
-        if max_desc > 0 and len(first_subj) > max_desc:
-            first_subj = first_subj[:max_desc] + "..."
-        breakdown = f"{n} item(s) [{pending}p/{in_progress}ip/{completed}c]"
-        if first_subj:
-            return f"TODOS: {breakdown} first: {first_subj}"
-        return f"TODOS: {breakdown}"
-
-    return tool_name
+    return handler(tool_input, tool_response, max_desc)
 
 
 def find_line_number(
@@ -424,9 +461,240 @@ def get_command_content(tool_info: ToolInfo, config: Optional[Config] = None) ->
     return get_command_content_structured(tool_info, config).legacy_string
 
 
+def _simple(content: str) -> CommandContent:
+    """CommandContent where the string IS the content on every channel."""
+    return CommandContent(raw_content=content, legacy_string=content, summary_template=None)
+
+
+def _cc_bash(tool_info: ToolInfo, config: Optional[Config]) -> CommandContent:
+    return _simple(tool_info.input.get("command", ""))
+
+
+def _cc_read(tool_info: ToolInfo, config: Optional[Config]) -> CommandContent:
+    tool_input = tool_info.input
+    path = tool_input.get("file_path", "")
+    offset = tool_input.get("offset")  # Line number to start from
+    limit = tool_input.get("limit")    # Number of lines to read
+
+    if not path:
+        return _simple("")
+
+    # Build path with line info for VS Code clickability
+    if offset:
+        if limit:
+            end_line = offset + limit - 1
+            path_display = f"{path}:{offset}-{end_line}"
+        else:
+            path_display = f"{path}:{offset}"
+    else:
+        path_display = path
+
+    if limit and not offset:
+        return _simple(f'"{path_display}" ({limit}L)')
+    return _simple(f'"{path_display}"')
+
+
+def _cc_write(tool_info: ToolInfo, config: Optional[Config]) -> CommandContent:
+    tool_input = tool_info.input
+    path = tool_input.get("file_path", "")
+    content = tool_input.get("content", "")
+    line_count = len(content.splitlines()) if content else 0
+    line_info = f" ({line_count}L)" if line_count > 0 else ""
+    if path and content:
+        preview = truncate_preview(content, config=config)
+        legacy = f'"{path}" ← "{preview}"{line_info}'
+        template = f'"{path}" ← "{{snippet}}"{line_info}'
+        return CommandContent(raw_content=content, legacy_string=legacy, summary_template=template)
+    s = f'"{path}"' if path else ""
+    return CommandContent(raw_content=content, legacy_string=s, summary_template=None)
+
+
+def _cc_edit(tool_info: ToolInfo, config: Optional[Config]) -> CommandContent:
+    tool_input = tool_info.input
+    path = tool_input.get("file_path", "")
+    old_string = tool_input.get("old_string", "")
+    new_string = tool_input.get("new_string", "")
+    old_lines = len(old_string.splitlines()) if old_string else 0
+    new_lines = len(new_string.splitlines()) if new_string else 0
+    if old_lines == new_lines:
+        line_info = f" ({new_lines}L)" if new_lines > 0 else ""
+    else:
+        line_info = f" (-{old_lines}/+{new_lines}L)"
+    line_num = find_line_number(path, new_string, config=config) if path and new_string else None
+    path_with_line = f"{path}:{line_num}" if line_num else path
+    if path and new_string:
+        preview = truncate_preview(new_string, config=config)
+        legacy = f'"{path_with_line}" ← "{preview}"{line_info}'
+        template = f'"{path_with_line}" ← "{{snippet}}"{line_info}'
+        return CommandContent(raw_content=new_string, legacy_string=legacy, summary_template=template)
+    s = f'"{path_with_line}"' if path else ""
+    return CommandContent(raw_content=new_string, legacy_string=s, summary_template=None)
+
+
+def _cc_multiedit(tool_info: ToolInfo, config: Optional[Config]) -> CommandContent:
+    path = tool_info.input.get("file_path", "")
+    return _simple(f'"{path}"' if path else "")
+
+
+def _cc_todowrite(tool_info: ToolInfo, config: Optional[Config]) -> CommandContent:
+    todos = tool_info.input.get("todos", [])
+    return _simple(_dumps_compact(todos))
+
+
+def _cc_ls(tool_info: ToolInfo, config: Optional[Config]) -> CommandContent:
+    path = tool_info.input.get("path", "")
+    return _simple(f'"{path}"' if path else "")
+
+
+def _cc_glob(tool_info: ToolInfo, config: Optional[Config]) -> CommandContent:
+    tool_input = tool_info.input
+    pattern = tool_input.get("pattern", "")
+    search_path = tool_input.get("path", "")
+    return _simple(f'{pattern} in "{search_path}"' if search_path else pattern)
+
+
+def _cc_grep(tool_info: ToolInfo, config: Optional[Config]) -> CommandContent:
+    tool_input = tool_info.input
+    pattern = tool_input.get("pattern", "")
+    glob_filter = tool_input.get("glob", "")
+    search_path = tool_input.get("path", "")
+
+    result = pattern
+    if glob_filter:
+        result += f' | "{glob_filter}"'
+
+    if search_path:
+        cwd = tool_info.raw_json.get("cwd", "")
+        separator = " in " if glob_filter else " | "
+        try:
+            search_path_obj = Path(search_path).resolve()
+            cwd_obj = Path(cwd).resolve() if cwd else None
+
+            if search_path_obj.is_file():
+                result += f'{separator}"{search_path_obj}"'
+            elif cwd_obj and search_path_obj != cwd_obj:
+                try:
+                    rel = search_path_obj.relative_to(cwd_obj)
+                    result += f'{separator}"{rel}/"'
+                except ValueError:
+                    result += f'{separator}"{search_path_obj}"'
+        except Exception:
+            result += f'{separator}"{search_path}"'
+
+    return _simple(result)
+
+
+def _cc_web(tool_info: ToolInfo, config: Optional[Config]) -> CommandContent:
+    return _simple(tool_info.input.get("url") or tool_info.input.get("query", ""))
+
+
+def _cc_plan_mode(tool_info: ToolInfo, config: Optional[Config]) -> CommandContent:
+    return _simple("")
+
+
+def _cc_task_output(tool_info: ToolInfo, config: Optional[Config]) -> CommandContent:
+    # #87 follow-up: extract tool_response.task.output AND emit a
+    # `{snippet}` template so per-channel max_chars actually applies.
+    # Without the template, DefaultFormatter takes the legacy_complete
+    # bypass at default.py:60-62 -- no truncation, sesslog and tools
+    # produce byte-identical output. With the template, the snippet
+    # portion is truncated per channel while `#{task_id} -> ` prefix
+    # stays intact for identification.
+    task_id = tool_info.input.get("task_id", "")
+    response_task = (tool_info.raw_json.get("tool_response") or {}).get("task") or {}
+    output = response_task.get("output", "")
+    if output:
+        template = f"#{task_id} -> {{snippet}}"
+        legacy = f"#{task_id} -> {output}"
+        return CommandContent(raw_content=output, legacy_string=legacy, summary_template=template)
+    return _simple(f"#{task_id}")
+
+
+def _cc_task_stop(tool_info: ToolInfo, config: Optional[Config]) -> CommandContent:
+    # #87 follow-up: include tool_response.message so the entry shows
+    # outcome (e.g., "Task 42 stopped successfully"), not just the id.
+    task_id = tool_info.input.get("task_id", "")
+    response = tool_info.raw_json.get("tool_response") or {}
+    message = response.get("message", "")
+    if message:
+        return _simple(f"#{task_id} | {message}")
+    return _simple(f"#{task_id}")
+
+
+def _cc_tool_search(tool_info: ToolInfo, config: Optional[Config]) -> CommandContent:
+    return _simple(tool_info.input.get("query", ""))
+
+
+def _cc_task_prompt(tool_info: ToolInfo, config: Optional[Config]) -> CommandContent:
+    return _simple(tool_info.input.get("prompt", ""))
+
+
+def _cc_skill(tool_info: ToolInfo, config: Optional[Config]) -> CommandContent:
+    # Skill keeps its own preview length (config.performance.skill_args_length,
+    # default 100) — distinct from the global content_preview_length (default 20).
+    # We pre-truncate at handler time and skip the {snippet} template path so
+    # the per-channel verbosity walk doesn't override the Skill-specific budget.
+    skill_name = tool_info.input.get("skill", "")
+    skill_args = tool_info.input.get("args", "")
+    max_args = config.performance.skill_args_length if config else 100
+    if skill_args and max_args > 0:
+        preview = truncate_preview(skill_args, max_len=max_args, config=config)
+        return _simple(f'{skill_name} ← "{preview}"')
+    return _simple(skill_name)
+
+
+def _cc_task_family(tool_info: ToolInfo, config: Optional[Config]) -> CommandContent:
+    return _simple(get_task_content(tool_info.name, tool_info.raw_json, config))
+
+
+def _cc_fallback(tool_info: ToolInfo, config: Optional[Config]) -> CommandContent:
+    # For unknown tools, try common field names. Order matters: more
+    # specific/distinctive fields first so collisions are less likely.
+    # `command` covers shell-like tools (Bash/PowerShell pattern), `skill`
+    # covers Skill-like, `subject` covers task-like, etc. New tools that
+    # match these shapes will "just work" without needing a custom handler.
+    tool_input = tool_info.input
+    for field in ("command", "pattern", "url", "prompt", "query", "skill", "subject", "content"):
+        if field in tool_input:
+            return _simple(str(tool_input[field]))
+    return _simple("")
+
+
+# Tool name → handler, one dict probe per call instead of an if/elif walk
+# over every known tool. Aliases (PowerShell→Bash, WebFetch→WebSearch, ...)
+# map to the same function; anything unlisted takes _cc_fallback's
+# common-field probe.
+_COMMAND_HANDLERS: dict[str, Callable[[ToolInfo, Optional[Config]], CommandContent]] = {
+    "Bash": _cc_bash,
+    "PowerShell": _cc_bash,
+    "Read": _cc_read,
+    "Write": _cc_write,
+    "Edit": _cc_edit,
+    "MultiEdit": _cc_multiedit,
+    "TodoWrite": _cc_todowrite,
+    "LS": _cc_ls,
+    "Glob": _cc_glob,
+    "Grep": _cc_grep,
+    "WebSearch": _cc_web,
+    "WebFetch": _cc_web,
+    "EnterPlanMode": _cc_plan_mode,
+    "ExitPlanMode": _cc_plan_mode,
+    "TaskOutput": _cc_task_output,
+    "TaskStop": _cc_task_stop,
+    "tool_search_tool_regex": _cc_tool_search,
+    "tool_search_tool_bm25": _cc_tool_search,
+    "Task": _cc_task_prompt,
+    "Skill": _cc_skill,
+    "TaskCreate": _cc_task_family,
+    "TaskUpdate": _cc_task_family,
+    "TaskList": _cc_task_family,
+    "TaskGet": _cc_task_family,
+}
+
+
 def get_command_content_structured(
     tool_info: ToolInfo, config: Optional[Config] = None,
-):
+) -> CommandContent:
     """Extract command content as a CommandContent dataclass.
 
     Returns CommandContent(raw_content, legacy_string, summary_template).
@@ -435,195 +703,8 @@ def get_command_content_structured(
     in the formatter dispatch. For non-rich handlers, summary_template is
     None and the legacy_string IS the content (no per-channel truncation).
     """
-    from cclogger.models import CommandContent
-
-    tool_input = tool_info.input
-
-    if tool_info.name in ("Bash", "PowerShell"):
-        cmd = tool_input.get("command", "")
-        return CommandContent(raw_content=cmd, legacy_string=cmd, summary_template=None)
-
-    elif tool_info.name == "Read":
-        path = tool_input.get("file_path", "")
-        offset = tool_input.get("offset")  # Line number to start from
-        limit = tool_input.get("limit")    # Number of lines to read
-
-        if not path:
-            return CommandContent(raw_content="", legacy_string="", summary_template=None)
-
-        # Build path with line info for VS Code clickability
-        if offset:
-            if limit:
-                end_line = offset + limit - 1
-                path_display = f"{path}:{offset}-{end_line}"
-            else:
-                path_display = f"{path}:{offset}"
-        else:
-            path_display = path
-
-        if limit and not offset:
-            s = f'"{path_display}" ({limit}L)'
-        else:
-            s = f'"{path_display}"'
-        return CommandContent(raw_content=s, legacy_string=s, summary_template=None)
-
-    elif tool_info.name == "Write":
-        path = tool_input.get("file_path", "")
-        content = tool_input.get("content", "")
-        line_count = len(content.splitlines()) if content else 0
-        line_info = f" ({line_count}L)" if line_count > 0 else ""
-        if path and content:
-            preview = truncate_preview(content, config=config)
-            legacy = f'"{path}" ← "{preview}"{line_info}'
-            template = f'"{path}" ← "{{snippet}}"{line_info}'
-            return CommandContent(raw_content=content, legacy_string=legacy, summary_template=template)
-        s = f'"{path}"' if path else ""
-        return CommandContent(raw_content=content, legacy_string=s, summary_template=None)
-
-    elif tool_info.name == "Edit":
-        path = tool_input.get("file_path", "")
-        old_string = tool_input.get("old_string", "")
-        new_string = tool_input.get("new_string", "")
-        old_lines = len(old_string.splitlines()) if old_string else 0
-        new_lines = len(new_string.splitlines()) if new_string else 0
-        if old_lines == new_lines:
-            line_info = f" ({new_lines}L)" if new_lines > 0 else ""
-        else:
-            line_info = f" (-{old_lines}/+{new_lines}L)"
-        line_num = find_line_number(path, new_string, config=config) if path and new_string else None
-        path_with_line = f"{path}:{line_num}" if line_num else path
-        if path and new_string:
-            preview = truncate_preview(new_string, config=config)
-            legacy = f'"{path_with_line}" ← "{preview}"{line_info}'
-            template = f'"{path_with_line}" ← "{{snippet}}"{line_info}'
-            return CommandContent(raw_content=new_string, legacy_string=legacy, summary_template=template)
-        s = f'"{path_with_line}"' if path else ""
-        return CommandContent(raw_content=new_string, legacy_string=s, summary_template=None)
-
-    elif tool_info.name == "MultiEdit":
-        path = tool_input.get("file_path", "")
-        s = f'"{path}"' if path else ""
-        return CommandContent(raw_content=s, legacy_string=s, summary_template=None)
-
-    elif tool_info.name == "TodoWrite":
-        todos = tool_input.get("todos", [])
-        s = json.dumps(todos, separators=(",", ":"))
-        return CommandContent(raw_content=s, legacy_string=s, summary_template=None)
-
-    elif tool_info.name == "LS":
-        path = tool_input.get("path", "")
-        s = f'"{path}"' if path else ""
-        return CommandContent(raw_content=s, legacy_string=s, summary_template=None)
-
-    elif tool_info.name == "Glob":
-        pattern = tool_input.get("pattern", "")
-        search_path = tool_input.get("path", "")
-        s = f'{pattern} in "{search_path}"' if search_path else pattern
-        return CommandContent(raw_content=s, legacy_string=s, summary_template=None)
-
-    elif tool_info.name == "Grep":
-        pattern = tool_input.get("pattern", "")
-        glob_filter = tool_input.get("glob", "")
-        search_path = tool_input.get("path", "")
-
-        result = pattern
-        if glob_filter:
-            result += f' | "{glob_filter}"'
-
-        if search_path:
-            cwd = tool_info.raw_json.get("cwd", "")
-            separator = " in " if glob_filter else " | "
-            try:
-                search_path_obj = Path(search_path).resolve()
-                cwd_obj = Path(cwd).resolve() if cwd else None
-
-                if search_path_obj.is_file():
-                    result += f'{separator}"{search_path_obj}"'
-                elif cwd_obj and search_path_obj != cwd_obj:
-                    try:
-                        rel = search_path_obj.relative_to(cwd_obj)
-                        result += f'{separator}"{rel}/"'
-                    except ValueError:
-                        result += f'{separator}"{search_path_obj}"'
-            except Exception:
-                result += f'{separator}"{search_path}"'
-
-        return CommandContent(raw_content=result, legacy_string=result, summary_template=None)
-
-    elif tool_info.name in ("WebSearch", "WebFetch"):
-        s = tool_input.get("url") or tool_input.get("query", "")
-        return CommandContent(raw_content=s, legacy_string=s, summary_template=None)
-
-    elif tool_info.name in ("EnterPlanMode", "ExitPlanMode"):
-        return CommandContent(raw_content="", legacy_string="", summary_template=None)
-
-    elif tool_info.name == "TaskOutput":
-        # #87 follow-up: extract tool_response.task.output AND emit a
-        # `{snippet}` template so per-channel max_chars actually applies.
-        # Without the template, DefaultFormatter takes the legacy_complete
-        # bypass at default.py:60-62 -- no truncation, sesslog and tools
-        # produce byte-identical output. With the template, the snippet
-        # portion is truncated per channel while `#{task_id} -> ` prefix
-        # stays intact for identification.
-        task_id = tool_input.get("task_id", "")
-        response_task = (tool_info.raw_json.get("tool_response") or {}).get("task") or {}
-        output = response_task.get("output", "")
-        if output:
-            template = f"#{task_id} -> {{snippet}}"
-            legacy = f"#{task_id} -> {output}"
-            return CommandContent(raw_content=output, legacy_string=legacy, summary_template=template)
-        s = f"#{task_id}"
-        return CommandContent(raw_content=s, legacy_string=s, summary_template=None)
-
-    elif tool_info.name == "TaskStop":
-        # #87 follow-up: include tool_response.message so the entry shows
-        # outcome (e.g., "Task 42 stopped successfully"), not just the id.
-        task_id = tool_input.get("task_id", "")
-        response = tool_info.raw_json.get("tool_response") or {}
-        message = response.get("message", "")
-        if message:
-            s = f"#{task_id} | {message}"
-        else:
-            s = f"#{task_id}"
-        return CommandContent(raw_content=s, legacy_string=s, summary_template=None)
-
-    elif tool_info.name in ("tool_search_tool_regex", "tool_search_tool_bm25"):
-        s = tool_input.get("query", "")
-        return CommandContent(raw_content=s, legacy_string=s, summary_template=None)
-
-    elif tool_info.name == "Task":
-        s = tool_input.get("prompt", "")
-        return CommandContent(raw_content=s, legacy_string=s, summary_template=None)
-
-    elif tool_info.name == "Skill":
-        # Skill keeps its own preview length (config.performance.skill_args_length,
-        # default 100) — distinct from the global content_preview_length (default 20).
-        # We pre-truncate at handler time and skip the {snippet} template path so
-        # the per-channel verbosity walk doesn't override the Skill-specific budget.
-        skill_name = tool_input.get("skill", "")
-        skill_args = tool_input.get("args", "")
-        max_args = config.performance.skill_args_length if config else 100
-        if skill_args and max_args > 0:
-            preview = truncate_preview(skill_args, max_len=max_args, config=config)
-            legacy = f'{skill_name} ← "{preview}"'
-            return CommandContent(raw_content=legacy, legacy_string=legacy, summary_template=None)
-        return CommandContent(raw_content=skill_name, legacy_string=skill_name, summary_template=None)
-
-    elif tool_info.name in ("TaskCreate", "TaskUpdate", "TaskList", "TaskGet"):
-        s = get_task_content(tool_info.name, tool_info.raw_json, config)
-        return CommandContent(raw_content=s, legacy_string=s, summary_template=None)
-
-    else:
-        # For unknown tools, try common field names. Order matters: more
-        # specific/distinctive fields first so collisions are less likely.
-        # `command` covers shell-like tools (Bash/PowerShell pattern), `skill`
-        # covers Skill-like, `subject` covers task-like, etc. New tools that
-        # match these shapes will "just work" without needing a custom handler.
-        for field in ("command", "pattern", "url", "prompt", "query", "skill", "subject", "content"):
-            if field in tool_input:
-                s = str(tool_input[field])
-                return CommandContent(raw_content=s, legacy_string=s, summary_template=None)
-        return CommandContent(raw_content="", legacy_string="", summary_template=None)
+    handler = _COMMAND_HANDLERS.get(tool_info.name, _cc_fallback)
+    return handler(tool_info, config)
 
 
 # ============================================================================
@@ -631,6 +712,22 @@ def get_command_content_structured(
 # ============================================================================
 
 
+@functools.lru_cache(maxsize=8)
+def _fmt_datetime(mode: str, epoch_s: int) -> str:
+    """strftime memoized per (mode, whole second).
+
+    The formatted string only changes once per second, but bursts of
+    tool calls arrive much faster than that -- the cache collapses each
+    burst to a single strftime.
+    """
+    ts = datetime.fromtimestamp(epoch_s)
+    if mode == "date":
+        return f"[[{ts.strftime('%Y-%m-%d')}]] "
+    elif mode == "full":
+        return f"[[{ts.strftime('%Y-%m-%d %H:%M:%S')}]] "
+    return ""
+
+
 def format_datetime(mode: str, timestamp: Optional[datetime] = None) -> str:
     """Format datetime string based on mode.
 
@@ -639,11 +736,17 @@ def format_datetime(mode: str, timestamp: Optional[datetime] = None) -> str:
         timestamp: The datetime to format. If None, uses datetime.now() (legacy fallback).
     """
     ts = timestamp or datetime.now()
-    if mode == "date":
-        return f"[[{ts.strftime('%Y-%m-%d')}]] "
-    elif mode == "full":
-        return f"[[{ts.strftime('%Y-%m-%d %H:%M:%S')}]] "
-    return ""
+    return _fmt_datetime(mode, int(ts.timestamp()))
+
+
+@functools.lru_cache(maxsize=1)
+def _cwd_cached() -> str:
+    """os.getcwd(), computed once per hook process.
+
+    The hook never chdirs, so the working directory is fixed for the
+    process lifetime -- no need to repeat the syscall per entry.
+    """
+    return os.getcwd()
 
 
 def format_tool_name(tool_info: ToolInfo) -> str:
@@ -679,6 +782,25 @@ def _role_from_tool_name(tool_name: str) -> str:
     return "".join(out_chars)
 
 
+def _verbosity_body(content: str, tool_display: str, tool_info: ToolInfo,
+                    config: Config) -> str:
+    """Shape `content` per the verbosity ladder.
+
+    Shared by the legacy body and the rich-format summary template, which
+    run the identical ladder with a different string substituted in.
+    Verbosity 0 and 1 are the common case and intentionally first: bare
+    content, no tool prefix, nothing else computed.
+    """
+    v = config.verbosity
+    if v in (0, 1):
+        return content
+    if v == 3 and tool_info.description:
+        return f"{tool_display}: {content} {tool_info.description}"
+    if v == 4:
+        return f"{tool_display}: {content} {_dumps_compact(tool_info.input)}"
+    return f"{tool_display}: {content}"
+
+
 def generate_entry(tool_info: ToolInfo, config: Config, command_content,
                    event_time: datetime):
     """Generate a LogEntry for the tool call.
@@ -708,7 +830,7 @@ def generate_entry(tool_info: ToolInfo, config: Config, command_content,
 
     pwd_part = ""
     if config.pwd_enabled:
-        pwd_part = f' ["{os.getcwd()}"]'
+        pwd_part = f' ["{_cwd_cached()}"]'
 
     # Get tool name with agent context
     tool_display = format_tool_name(tool_info)
@@ -722,25 +844,12 @@ def generate_entry(tool_info: ToolInfo, config: Config, command_content,
     # Determine the legacy body content based on verbosity + action-only.
     # This builds the v0.3.6-shaped string used to populate _legacy_complete
     # so non-rich entries (and channels with no options) stay byte-identical.
-    if should_use_action_only(tool_info.name, config):
+    # action-only is resolved once and reused for the summary below.
+    action_only = should_use_action_only(tool_info.name, config)
+    if action_only:
         legacy_body = tool_display
     else:
-        if config.verbosity == 0:
-            legacy_body = legacy_string
-        elif config.verbosity == 1:
-            legacy_body = legacy_string
-        elif config.verbosity == 2:
-            legacy_body = f"{tool_display}: {legacy_string}"
-        elif config.verbosity == 3:
-            if tool_info.description:
-                legacy_body = f"{tool_display}: {legacy_string} {tool_info.description}"
-            else:
-                legacy_body = f"{tool_display}: {legacy_string}"
-        elif config.verbosity == 4:
-            tool_input_json = json.dumps(tool_info.input, separators=(",", ":"))
-            legacy_body = f"{tool_display}: {legacy_string} {tool_input_json}"
-        else:
-            legacy_body = f"{tool_display}: {legacy_string}"
+        legacy_body = _verbosity_body(legacy_string, tool_display, tool_info, config)
 
     legacy_complete = f"{datetime_part}{{{legacy_body} }}{pwd_part}"
 
@@ -748,21 +857,8 @@ def generate_entry(tool_info: ToolInfo, config: Config, command_content,
     # rich-format template, embed it in the same verbosity-shaped body so
     # DefaultFormatter can substitute the snippet per channel verbosity.
     summary: Optional[str] = None
-    if summary_template and not should_use_action_only(tool_info.name, config):
-        if config.verbosity == 0 or config.verbosity == 1:
-            summary = summary_template
-        elif config.verbosity == 2:
-            summary = f"{tool_display}: {summary_template}"
-        elif config.verbosity == 3:
-            if tool_info.description:
-                summary = f"{tool_display}: {summary_template} {tool_info.description}"
-            else:
-                summary = f"{tool_display}: {summary_template}"
-        elif config.verbosity == 4:
-            tool_input_json = json.dumps(tool_info.input, separators=(",", ":"))
-            summary = f"{tool_display}: {summary_template} {tool_input_json}"
-        else:
-            summary = f"{tool_display}: {summary_template}"
+    if summary_template and not action_only:
+        summary = _verbosity_body(summary_template, tool_display, tool_info, config)
 
     return LogEntry(
         raw_content=raw_content,
@@ -14,20 +14,21 @@ from pathlib import Path
 from typing import Any, Optional
 
 from cclogger.categorize import get_subtype
-from cclogger.debug import debug_log
+from cclogger.debug import debug_log, get_home
 from cclogger.file_io import (
     atomic_append,
     check_time_gap,
+    ensure_dir,
     migrate_overflow_files,
     sweep_orphan_session_name_files,
 )
-from cclogger.formatters import format_datetime, format_for_channel
+from cclogger.formatters import format_for_channel
 from cclogger.markers import (
+    build_session_marker,
     count_compaction_markers,
     get_run_number,
     is_new_session_run,
     mark_session_started,
-    write_session_marker,
 )
 from cclogger.models import Config, SessionContext
 from cclogger.reconciliation import (
@@ -48,20 +49,28 @@ class SessionLogger:
     # Prefix removed - Python is now the primary hook
     FILE_PREFIX = ""
 
-    def __init__(self, config: Config, session: SessionContext, event_time: datetime):
+    def __init__(self, config: Config, session: SessionContext, event_time: datetime,
+                 session_dir: Optional[Path] = None):
         self.config = config
         self.session = session
         self.event_time = event_time
-        self.sesslog_base = Path.home() / ".claude" / "sesslogs"
-        self.sesslog_base.mkdir(parents=True, exist_ok=True)
+        self.sesslog_base = get_home() / ".claude" / "sesslogs"
+        ensure_dir(self.sesslog_base)
 
         # Get effective session name (from session or existing files/directories)
         self.effective_name = get_effective_session_name(
             session.session_id, session.session_name, self.sesslog_base
         )
 
-        # Build and create session directory
-        self.session_dir = self._get_or_create_session_directory()
+        # Build and create session directory. main() has usually already
+        # reconciled the directory for this event and passes it in; reuse
+        # it and skip the second reconcile pass -- but only when the
+        # effective name matches what main() reconciled with (they diverge
+        # for unnamed sessions whose name was recovered from disk).
+        if session_dir is not None and self.effective_name == session.session_name:
+            self.session_dir = session_dir
+        else:
+            self.session_dir = self._get_or_create_session_directory()
 
         # Reconcile files and get target paths (if we have a name)
         self._reconciled = False
@@ -77,7 +86,10 @@ class SessionLogger:
         # (so canonical renames have stabilized) and BEFORE
         # `_maybe_write_session_marker` (so markers land in the merged
         # file with the correct session name).
-        if is_new_session_run(self.session.session_id):
+        # One stat answers both this migration gate and the marker gate in
+        # _maybe_write_session_marker -- the flag can't flip mid-construction.
+        self._is_new_run = is_new_session_run(self.session.session_id)
+        if self._is_new_run:
             migrate_overflow_files(self.session_dir)
             if self.effective_name:
                 sweep_orphan_session_name_files(
@@ -206,22 +218,38 @@ class SessionLogger:
         SessionContext.get_filename_context() universally; channel identity
         is carried entirely by file_prefix.
         """
+        # Channel-name -> resolved path. Inputs (session_dir, filename
+        # context, routing config) are fixed for the lifetime of this
+        # instance, so each channel's path is computed at most once even
+        # when markers + entries hit the same channels repeatedly. Created
+        # lazily so partially-constructed loggers (tests) work too.
+        cache: Optional[dict[str, Path]] = getattr(self, "_channel_paths", None)
+        if cache is None:
+            cache = self._channel_paths = {}
+        cached = cache.get(channel_name)
+        if cached is not None:
+            return cached
+
+        path: Optional[Path] = None
         channel = self.config.routing.channels.get(channel_name)
         if channel:
             filename = f"{channel.file_prefix}{self.session.get_filename_context()}.log"
-            return self.session_dir / filename
-
-        # Subtype channel? Format is "<base>-<subtype>" -- inherit base prefix.
-        if "-" in channel_name:
+            path = self.session_dir / filename
+        elif "-" in channel_name:
+            # Subtype channel? Format is "<base>-<subtype>" -- inherit base prefix.
             base_name, _, subtype = channel_name.partition("-")
             base_channel = self.config.routing.channels.get(base_name)
             if base_channel and subtype:
                 base_prefix = base_channel.file_prefix.rstrip("_")
                 derived_prefix = f"{base_prefix}-{subtype}_"
                 filename = f"{derived_prefix}{self.session.get_filename_context()}.log"
-                return self.session_dir / filename
+                path = self.session_dir / filename
 
-        raise ValueError(f"Unknown channel: {channel_name}")
+        if path is None:
+            raise ValueError(f"Unknown channel: {channel_name}")
+
+        cache[channel_name] = path
+        return path
 
     def _maybe_write_session_marker(self) -> None:
         """Write session-start or compaction marker if this is first call of a new run.
@@ -234,12 +262,12 @@ class SessionLogger:
         receive no markers — they materialize lazily on first write and may
         not exist at marker time; keeping them clean is the documented policy.
         """
-        if not is_new_session_run(self.session.session_id):
+        if not self._is_new_run:
             return  # Already wrote marker for this run
 
         # Read source from state file (#14 - distinguish compaction from true start)
         source = None
-        source_file = Path.home() / ".claude" / "session-states" / f"{self.session.session_id}.source"
+        source_file = get_home() / ".claude" / "session-states" / f"{self.session.session_id}.source"
         try:
             if source_file.exists():
                 source = source_file.read_text().strip()
@@ -255,10 +283,14 @@ class SessionLogger:
             # Run number only increments for true session starts
             marker_number = get_run_number(self.session.session_id, self.unified_log_path)
 
-        # Broadcast to all enabled channels that don't suppress markers
+        # Broadcast to all enabled channels that don't suppress markers.
+        # The marker text is identical per channel -- format once, append N.
         target_paths = self._collect_marker_target_paths()
+        marker = build_session_marker(
+            marker_number, self.event_time, self.effective_name, source
+        )
         for path in target_paths:
-            write_session_marker(path, marker_number, self.event_time, self.effective_name, source)
+            atomic_append(path, marker)
 
         # Mark session as started
         mark_session_started(self.session.session_id)
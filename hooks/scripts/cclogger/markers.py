@@ -8,10 +8,12 @@ get_run_number caches the result per session in `~/.claude/session-states/`.
 
 from __future__ import annotations
 
+import mmap
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from cclogger.debug import get_home
 from cclogger.file_io import atomic_append
 
 
@@ -36,20 +38,40 @@ def count_compaction_markers(file_path: Path) -> int:
 
 
 def _count_markers(file_path: Path, signature: str) -> int:
-    """Count markers matching a specific signature in a log file."""
+    """Count markers matching a specific signature in a log file.
+
+    mmap + find gives vectorized byte scans over the raw file -- no
+    per-line Python loop and no UTF-8 decode of the whole log just to
+    locate an exact byte sequence (and no copy of the file into a bytes
+    object either; mmap has no .count, hence the find loop). Each
+    marker emits its signature on exactly one line, so occurrence count
+    equals the old per-line count.
+    """
     if not file_path.exists():
         return 0
 
-    count = 0
+    sig = signature.encode("utf-8")
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-            for line in f:
-                if signature in line:
+        with open(file_path, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return 0  # Empty file can't be mapped (and has no markers)
+            with mm:
+                count = 0
+                idx = mm.find(sig)
+                while idx != -1:
                     count += 1
+                    idx = mm.find(sig, idx + len(sig))
+                return count
     except Exception:
         return 0
 
-    return count
+
+# Run numbers per session, resolved at most once per process. The .run
+# file stays the cross-process source of truth; this dict just saves the
+# exists+read round-trip on repeat calls within one hook invocation.
+_RUN_CACHE: dict[str, int] = {}
 
 
 def get_run_number(session_id: str, file_path: Path) -> int:
@@ -58,13 +80,19 @@ def get_run_number(session_id: str, file_path: Path) -> int:
     Uses cache for performance within a session run,
     falls back to counting markers in file (always authoritative).
     """
-    state_dir = Path.home() / ".claude" / "session-states"
+    cached = _RUN_CACHE.get(session_id)
+    if cached is not None:
+        return cached
+
+    state_dir = get_home() / ".claude" / "session-states"
     cache_file = state_dir / f"{session_id}.run"
 
-    # Fast path: cache exists
+    # Fast path: cache file exists
     if cache_file.exists():
         try:
-            return int(cache_file.read_text().strip())
+            run_number = int(cache_file.read_text().strip())
+            _RUN_CACHE[session_id] = run_number
+            return run_number
         except (ValueError, OSError):
             pass  # Cache corrupted, regenerate
 
@@ -73,6 +101,7 @@ def get_run_number(session_id: str, file_path: Path) -> int:
     run_number = marker_count + 1
 
     # Cache for this session run
+    _RUN_CACHE[session_id] = run_number
     try:
         cache_file.write_text(str(run_number))
     except OSError:
@@ -82,15 +111,21 @@ def get_run_number(session_id: str, file_path: Path) -> int:
 
 
 def is_new_session_run(session_id: str) -> bool:
-    """Check if this is the first tool call of a new session run."""
-    state_dir = Path.home() / ".claude" / "session-states"
+    """Check if this is the first tool call of a new session run.
+
+    Deliberately uncached at this level: deleting the .started flag is
+    the documented way to force a new run, and a process-global memo
+    would mask that. SessionLogger checks once per construction and
+    reuses the answer (`_is_new_run`).
+    """
+    state_dir = get_home() / ".claude" / "session-states"
     flag_file = state_dir / f"{session_id}.started"
     return not flag_file.exists()
 
 
 def mark_session_started(session_id: str) -> None:
     """Mark that this session run has been started (marker written)."""
-    state_dir = Path.home() / ".claude" / "session-states"
+    state_dir = get_home() / ".claude" / "session-states"
     state_dir.mkdir(parents=True, exist_ok=True)
     flag_file = state_dir / f"{session_id}.started"
     try:
@@ -99,17 +134,19 @@ def mark_session_started(session_id: str) -> None:
         pass
 
 
-def write_session_marker(
-    file_path: Path,
+def build_session_marker(
     marker_number: int,
     event_time: datetime,
     session_name: Optional[str] = None,
     source: Optional[str] = None
-) -> None:
-    """Write a visual marker indicating a new session run or context compaction.
+) -> str:
+    """Build the visual marker text for a new session run or context compaction.
+
+    Separate from write_session_marker so broadcast callers (the marker
+    goes to every enabled channel) format the identical text once instead
+    of once per channel.
 
     Args:
-        file_path: Path to log file
         marker_number: Run # for session starts, Compaction # for compactions
         event_time: Timestamp for the marker
         session_name: Session name to display
@@ -133,4 +170,17 @@ def write_session_marker(
 ════════════════════════════════════════════════════════════════════════════════
 
 """
-    atomic_append(file_path, marker.strip())
+    return marker.strip()
+
+
+def write_session_marker(
+    file_path: Path,
+    marker_number: int,
+    event_time: datetime,
+    session_name: Optional[str] = None,
+    source: Optional[str] = None
+) -> None:
+    """Write a session-run / compaction marker to a single log file."""
+    atomic_append(file_path, build_session_marker(
+        marker_number, event_time, session_name, source
+    ))
@@ -510,7 +510,8 @@ class Config:
     verbosity: int = 2
     datetime_mode: str = "full"  # "full", "date", "none"
     pwd_enabled: bool = False
-    filter_include: list[str] = field(default_factory=list)
+    # Frozenset for O(1) membership in should_log_tool (checked per hook)
+    filter_include: frozenset[str] = field(default_factory=frozenset)
 
     # Action-only settings by category
     action_only: dict[str, bool] = field(
@@ -12,14 +12,80 @@ relocates them to match the current expected name.
 
 from __future__ import annotations
 
+import functools
+import os
 import re
 from pathlib import Path
 from typing import Optional
 
 from cclogger.debug import debug_log
+from cclogger.file_io import invalidate_append_handle
 from cclogger.session_naming import sanitize_dirname
 
 
+# Reconciliation patterns are interpolated with the session GUID (and
+# friends) at runtime, so they can't be plain module-level constants.
+# re's internal cache is small and shared process-wide; these helpers
+# pin the hot per-session patterns behind lru_cache instead, so each
+# distinct parameter tuple compiles exactly once per process.
+
+@functools.lru_cache(maxsize=128)
+def _dir_name_re(session_id: str) -> re.Pattern[str]:
+    """Matches `{name}__{guid}_...`, capturing the name."""
+    return re.compile(rf"^(.+)__{re.escape(session_id)}_")
+
+
+@functools.lru_cache(maxsize=128)
+def _file_name_re(session_id: str) -> re.Pattern[str]:
+    """Matches `__{NAME}__{guid}` / `__{NAME}--NNN__{guid}`, capturing NAME."""
+    return re.compile(rf"__([^_]+?)(?:--\d{{3}})?__{re.escape(session_id)}")
+
+
+@functools.lru_cache(maxsize=128)
+def _session_files_re(prefix: str, file_type: str, session_id: str) -> re.Pattern[str]:
+    """Matches all session files for one (prefix, type, guid) combination."""
+    return re.compile(
+        rf"^\.{re.escape(prefix)}{re.escape(file_type)}_[^_]+_.*{re.escape(session_id)}_\w+(\.log)?$"
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _max_seq_re(prefix: str, file_type: str, shell: str, session_name: str,
+                session_id: str, username: str) -> re.Pattern[str]:
+    """Matches sequenced filenames, capturing the --NNN number."""
+    return re.compile(
+        rf"^\.{re.escape(prefix)}{re.escape(file_type)}_{re.escape(shell)}__"
+        rf"{re.escape(session_name)}--(\d{{3}})__{re.escape(session_id)}_{re.escape(username)}(\.log)?$"
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _channel_basename_re(session_id: str) -> re.Pattern[str]:
+    """Matches any channel file for the session, capturing the basename."""
+    # `[\w-]+` allows subtype-derived basenames like "shell-bash" or "agents-help".
+    return re.compile(rf"^\.([\w-]+)_[\w.]+_.*{re.escape(session_id)}_\w+(\.log)?$")
+
+
+@functools.lru_cache(maxsize=128)
+def _classify_re(session_id: str) -> re.Pattern[str]:
+    """Single-scan classifier: splits prefix and channel basename.
+
+    Mirrors the find_session_files shape (`[^_]+` for both basename and
+    shell, `_` as the structural delimiter) so a file lands in exactly
+    the (prefix, basename) bucket whose per-category pattern would have
+    matched it. The optional group is tried before the basename, so
+    `.Python_sesslog_...` classifies as ("Python_", "sesslog") rather
+    than ("", "Python").
+    """
+    return re.compile(
+        rf"^\.(?P<prefix>Python_)?(?P<base>[^_]+)_[^_]+_.*{re.escape(session_id)}_\w+(\.log)?$"
+    )
+
+
+# Invariant pattern: `--NNN__` marks a sequenced filename.
+_SEQ_RE = re.compile(r"--\d{3}__")
+
+
 # ============================================================================
 # Session Directory Management
 # ============================================================================
@@ -30,10 +96,14 @@ def find_directory_by_guid(sesslog_base: Path, session_id: str) -> Optional[Path
 
     Returns the first matching directory, or None if not found.
     """
+    # os.scandir answers is_dir() from the dirent in most cases, where
+    # Path.iterdir + is_dir() pays a stat per entry. Name check first --
+    # it's the cheaper filter.
     try:
-        for item in sesslog_base.iterdir():
-            if item.is_dir() and session_id in item.name:
-                return item
+        with os.scandir(sesslog_base) as it:
+            for entry in it:
+                if session_id in entry.name and entry.is_dir():
+                    return Path(entry.path)
     except Exception:
         pass
     return None
@@ -50,7 +120,7 @@ def extract_name_from_directory(dir_path: Path, session_id: str) -> Optional[str
         return None  # Unnamed directory
 
     # Pattern: {name}__{guid}_{user}
-    match = re.match(rf"^(.+)__{re.escape(session_id)}_", dir_name)
+    match = _dir_name_re(session_id).match(dir_name)
     if match:
         return match.group(1)
     return None
@@ -94,6 +164,7 @@ def reconcile_session_directory(sesslog_base: Path, session_id: str,
         try:
             existing_dir.rename(expected_dir)
             debug_log(f"Renamed session directory: {existing_dir.name} -> {expected_dir_name}")
+            _EFFECTIVE_NAME.pop(session_id, None)
 
             # Rename files inside to match new session name (if we have a new name)
             if expected_name:
@@ -113,6 +184,7 @@ def reconcile_session_directory(sesslog_base: Path, session_id: str,
     # No existing directory - create new
     expected_dir.mkdir(parents=True, exist_ok=True)
     debug_log(f"Created session directory: {expected_dir_name}")
+    _EFFECTIVE_NAME.pop(session_id, None)
     return expected_dir, None
 
 
@@ -136,48 +208,54 @@ def _rename_files_for_session_change(directory: Path, old_session_name: Optional
 
     escaped_id = re.escape(session_id)
 
-    for f in directory.iterdir():
-        if not f.is_file():
-            continue
-
-        old_name = f.name
+    # Compile once per rename event, not once per file in the loop below.
+    if old_session_name:
+        # Named -> Renamed: replace session name in its structural position
+        # (between __ delimiters before GUID). Works for both base channels
+        # (.sesslog_shell__OLD__guid_user.log) and subtype derivatives
+        # (.shell-bash_shell__OLD__guid_user.log) identically.
+        rename_re = re.compile(rf"(?<=__){re.escape(old_session_name)}(?=__{escaped_id})")
+        insert_re = None
+    else:
+        # Unnamed -> Named: insert name before GUID. The leading
+        # `.{channel}_{shell-bits}_` part is captured greedily before
+        # `_{guid}_`, which works for both plain (.sesslog_) and
+        # subtype-derived (.shell-bash_) channel prefixes.
+        rename_re = None
+        insert_re = re.compile(rf"^(\.[\w-]+_[\w.]+)_{escaped_id}_")
+
+    with os.scandir(directory) as it:
+        for dirent in it:
+            old_name = dirent.name
+
+            # Skip anything that doesn't embed the session GUID + start with `.`
+            # (structural guard against non-log files and sentinels).
+            # Name checks first: they're free, where is_file() may stat.
+            if not old_name.startswith(".") or session_id not in old_name:
+                continue
+            if not dirent.is_file():
+                continue
 
-        # Skip anything that doesn't embed the session GUID + start with `.`
-        # (structural guard against non-log files and sentinels).
-        if not old_name.startswith(".") or session_id not in old_name:
-            continue
+            new_name = None
 
-        new_name = None
+            if rename_re is not None:
+                if rename_re.search(old_name):
+                    new_name = rename_re.sub(new_session_name, old_name)
+            else:
+                match = insert_re.match(old_name)
+                if match:
+                    prefix = match.group(1)
+                    suffix = old_name[len(match.group(0))-1:]  # Keep _{user}... part
+                    new_name = f"{prefix}__{new_session_name}__{session_id}{suffix}"
 
-        if old_session_name:
-            # Named -> Renamed: replace session name in its structural position
-            # (between __ delimiters before GUID). Works for both base channels
-            # (.sesslog_shell__OLD__guid_user.log) and subtype derivatives
-            # (.shell-bash_shell__OLD__guid_user.log) identically.
-            escaped_old = re.escape(old_session_name)
-            pattern = rf"(?<=__){escaped_old}(?=__{escaped_id})"
-            if re.search(pattern, old_name):
-                new_name = re.sub(pattern, new_session_name, old_name)
-        else:
-            # Unnamed -> Named: insert name before GUID. The leading
-            # `.{channel}_{shell-bits}_` part is captured greedily before
-            # `_{guid}_`, which works for both plain (.sesslog_) and
-            # subtype-derived (.shell-bash_) channel prefixes.
-            pattern = rf"^(\.[\w-]+_[\w.]+)_{escaped_id}_"
-            match = re.match(pattern, old_name)
-            if match:
-                prefix = match.group(1)
-                suffix = old_name[len(match.group(0))-1:]  # Keep _{user}... part
-                new_name = f"{prefix}__{new_session_name}__{session_id}{suffix}"
-
-        if new_name and new_name != old_name:
-            new_path = directory / new_name
-            if not new_path.exists():
-                try:
-                    f.rename(new_path)
-                    debug_log(f"Renamed file: {old_name} -> {new_name}")
-                except Exception as e:
-                    debug_log(f"Failed to rename file {old_name}: {e}")
+            if new_name and new_name != old_name:
+                new_path = directory / new_name
+                if not new_path.exists():
+                    try:
+                        Path(dirent.path).rename(new_path)
+                        debug_log(f"Renamed file: {old_name} -> {new_name}")
+                    except Exception as e:
+                        debug_log(f"Failed to rename file {old_name}: {e}")
 
 
 def build_session_directory(session_name: Optional[str], session_id: str,
@@ -218,15 +296,14 @@ def find_session_files(sesslog_dir: Path, session_id: str, prefix: str,
     #   .{prefix}{type}_{shell}_{guid}_{user}[.log]              (unnamed)
     #   .{prefix}{type}_{shell}__{name}__{guid}_{user}[.log]     (named)
     #   .{prefix}{type}_{shell}__{name}--NNN__{guid}_{user}[.log] (named with sequence)
-    pattern = re.compile(
-        rf"^\.{re.escape(prefix)}{re.escape(file_type)}_[^_]+_.*{re.escape(session_id)}_\w+(\.log)?$"
-    )
+    pattern = _session_files_re(prefix, file_type, session_id)
 
     matches = []
     try:
-        for f in sesslog_dir.iterdir():
-            if f.is_file() and pattern.match(f.name):
-                matches.append(f)
+        with os.scandir(sesslog_dir) as it:
+            for entry in it:
+                if pattern.match(entry.name) and entry.is_file():
+                    matches.append(Path(entry.path))
     except Exception as e:
         debug_log(f"Error scanning sesslog_dir: {e}")
 
@@ -237,18 +314,16 @@ def find_max_sequence(sesslog_dir: Path, prefix: str, file_type: str, shell: str
                       session_name: str, session_id: str, username: str) -> int:
     """Find the highest existing sequence number (--NNN) for this session."""
     # Pattern: .{prefix}{type}_{shell}__{name}--NNN__{guid}_{user}[.log]
-    pattern = re.compile(
-        rf"^\.{re.escape(prefix)}{re.escape(file_type)}_{re.escape(shell)}__"
-        rf"{re.escape(session_name)}--(\d{{3}})__{re.escape(session_id)}_{re.escape(username)}(\.log)?$"
-    )
+    pattern = _max_seq_re(prefix, file_type, shell, session_name, session_id, username)
 
     max_seq = -1
     try:
-        for f in sesslog_dir.iterdir():
-            match = pattern.match(f.name)
-            if match:
-                seq = int(match.group(1))
-                max_seq = max(max_seq, seq)
+        with os.scandir(sesslog_dir) as it:
+            for entry in it:
+                match = pattern.match(entry.name)
+                if match:
+                    seq = int(match.group(1))
+                    max_seq = max(max_seq, seq)
     except Exception:
         pass
 
@@ -286,14 +361,13 @@ def build_filename(prefix: str, file_type: str, shell: str, session_name: Option
 def has_sequence_number(filepath: Path) -> bool:
     """Check if a filename already has a sequence number (--NNN)."""
     # Matches --NNN__ pattern (works with or without .log extension)
-    return bool(re.search(r"--\d{3}__", filepath.name))
+    return bool(_SEQ_RE.search(filepath.name))
 
 
 def extract_session_name_from_file(filepath: Path, session_id: str) -> Optional[str]:
     """Extract session name from an existing filename."""
     # Pattern: __{NAME}__{guid} or __{NAME}--NNN__{guid}
-    pattern = re.compile(rf"__([^_]+?)(?:--\d{{3}})?__{re.escape(session_id)}")
-    match = pattern.search(filepath.name)
+    match = _file_name_re(session_id).search(filepath.name)
     if match:
         return match.group(1)
     return None
@@ -310,6 +384,10 @@ def safe_rename(src: Path, dst: Path) -> bool:
 
     try:
         src.rename(dst)
+        # file_io may hold an open append handle on the old path; drop it
+        # so the next write reopens at the new name instead of silently
+        # appending to the renamed inode.
+        invalidate_append_handle(src)
         debug_log(f"Renamed {src.name} to {dst.name}")
         return True
     except Exception as e:
@@ -317,50 +395,98 @@ def safe_rename(src: Path, dst: Path) -> bool:
         return False
 
 
+# Fallback session name per session_id, resolved at most once per process.
+# None is a valid cached answer ("no named directory or file exists yet").
+_EFFECTIVE_NAME: dict[str, Optional[str]] = {}
+
+
 def get_effective_session_name(session_id: str, session_name: Optional[str],
                                 sesslog_base: Path) -> Optional[str]:
     """Get session name, falling back to name from existing directories or files.
 
     If the current session has no name but a named directory exists,
     extract the name from that directory to maintain continuity.
+
+    The fallback scan runs at most once per session per process: the
+    answer lands in _EFFECTIVE_NAME (None included -- "scanned, nothing
+    named" is as cacheable as a hit) and reconcile_session_directory
+    drops the entry whenever it renames or creates a directory for the
+    session, the only events that change what a rescan would find.
     """
     if session_name:
         return session_name
 
+    if session_id in _EFFECTIVE_NAME:
+        return _EFFECTIVE_NAME[session_id]
+
     # Check if any named directories exist for this session
     try:
-        for item in sesslog_base.iterdir():
-            if session_id in item.name:
+        with os.scandir(sesslog_base) as it:
+            for entry in it:
+                if session_id not in entry.name:
+                    continue
                 # Check if it's a named directory (has name before __)
                 # Pattern: {name}__{guid}_{user} vs __{guid}_{user}
-                if item.is_dir() and not item.name.startswith("__"):
+                if entry.is_dir() and not entry.name.startswith("__"):
                     # Extract name from directory: {name}__{guid}_{user}
-                    match = re.match(rf"^(.+)__{re.escape(session_id)}_", item.name)
+                    match = _dir_name_re(session_id).match(entry.name)
                     if match:
                         extracted = match.group(1)
                         debug_log(f"Using session name from existing directory: {extracted}")
+                        _EFFECTIVE_NAME[session_id] = extracted
                         return extracted
 
                 # Also check files (for backward compatibility with flat files)
-                if item.is_file() and "__" in item.name:
-                    extracted = extract_session_name_from_file(item, session_id)
+                if entry.is_file() and "__" in entry.name:
+                    extracted = extract_session_name_from_file(Path(entry.path), session_id)
                     if extracted:
                         debug_log(f"Using session name from existing file: {extracted}")
+                        _EFFECTIVE_NAME[session_id] = extracted
                         return extracted
     except Exception:
         pass
 
+    _EFFECTIVE_NAME[session_id] = None
     return None
 
 
+def scan_session_files(sesslog_dir: Path,
+                       session_id: str) -> dict[tuple[str, str], list[Path]]:
+    """Classify every session file into a (prefix, basename) bucket in one scan.
+
+    One os.scandir pass replaces the per-category find_session_files
+    scans (2 prefixes x N channels meant 2N directory walks before).
+    Prefix is "Python_" or ""; basename covers declared channels and
+    subtype derivatives alike ("sesslog", "shell-bash", ...).
+    """
+    pattern = _classify_re(session_id)
+    buckets: dict[tuple[str, str], list[Path]] = {}
+    try:
+        with os.scandir(sesslog_dir) as it:
+            for entry in it:
+                match = pattern.match(entry.name)
+                if match and entry.is_file():
+                    key = (match.group("prefix") or "", match.group("base"))
+                    buckets.setdefault(key, []).append(Path(entry.path))
+    except OSError as e:
+        debug_log(f"Error scanning sesslog_dir: {e}")
+    return buckets
+
+
 def reconcile_single_category(sesslog_dir: Path, session_id: str, session_name: str,
                                shell: str, username: str, prefix: str,
-                               file_type: str) -> Optional[Path]:
+                               file_type: str,
+                               files: Optional[list[Path]] = None) -> Optional[Path]:
     """Reconcile files for a single category and return the target path.
 
     Returns the path to write to (the "current" file).
+
+    `files` lets batch callers (reconcile_session_files) pass the
+    category's bucket from one shared scan_session_files pass; when
+    omitted, the category is scanned individually.
     """
-    files = find_session_files(sesslog_dir, session_id, prefix, file_type)
+    if files is None:
+        files = find_session_files(sesslog_dir, session_id, prefix, file_type)
 
     # Build target filename (what the current file should be named)
     target_name = build_filename(prefix, file_type, shell, session_name,
@@ -435,22 +561,27 @@ def discover_channel_basenames(sesslog_dir: Path, session_id: str) -> set[str]:
     """
     if not sesslog_dir.exists():
         return set()
-    escaped_id = re.escape(session_id)
-    # `[\w-]+` allows subtype-derived basenames like "shell-bash" or "agents-help".
-    pattern = re.compile(rf"^\.([\w-]+)_[\w.]+_.*{escaped_id}_\w+(\.log)?$")
+    pattern = _channel_basename_re(session_id)
     basenames: set[str] = set()
     try:
-        for f in sesslog_dir.iterdir():
-            if not f.is_file():
-                continue
-            match = pattern.match(f.name)
-            if match:
-                basenames.add(match.group(1))
+        with os.scandir(sesslog_dir) as it:
+            for entry in it:
+                match = pattern.match(entry.name)
+                if match and entry.is_file():
+                    basenames.add(match.group(1))
     except OSError:
         pass
     return basenames
 
 
+# Reconciliation results per session GUID. A hit requires both the
+# session name and the directory mtime to be unchanged since the last
+# full pass -- any file rename or creation (ours or another process's)
+# bumps the directory mtime and forces a rescan, so staleness can't
+# hide a rename that still needs reconciling.
+_RECONCILE_CACHE: dict[str, tuple[str, int, dict[str, Path]]] = {}
+
+
 def reconcile_session_files(sesslog_dir: Path, session_id: str, session_name: str,
                             shell: str, username: str,
                             channel_names: list[str]) -> dict[str, Path]:
@@ -484,17 +615,32 @@ def reconcile_session_files(sesslog_dir: Path, session_id: str, session_name: st
     if not session_name:
         return {}  # Nothing to reconcile without a name
 
+    try:
+        dir_mtime = os.stat(sesslog_dir).st_mtime_ns
+    except OSError:
+        dir_mtime = None
+    cached = _RECONCILE_CACHE.get(session_id)
+    if (cached is not None and dir_mtime is not None
+            and cached[0] == session_name and cached[1] == dir_mtime):
+        return cached[2]
+
     targets: dict[str, Path] = {}
 
-    # Discover any subtype-derived basenames present on disk so we can
-    # rename them too. Base names that are already in `channel_names` are
-    # filtered out below (they get the full reconcile-and-target path).
-    discovered = discover_channel_basenames(sesslog_dir, session_id)
+    # One scan classifies every session file into (prefix, basename)
+    # buckets -- both for the declared channels below and for discovering
+    # subtype-derived basenames, which previously took its own pass.
+    buckets = scan_session_files(sesslog_dir, session_id)
     declared_set = set(channel_names)
-    subtype_basenames = discovered - declared_set
+    subtype_basenames = {base for _pfx, base in buckets} - declared_set
 
-    # All prefixes (Python_ kept for back-compat with v0.2.x file naming).
-    prefixes = ["", "Python_"]
+    # Prefixes: the Python_ half (back-compat with v0.2.x file naming)
+    # only runs when the scan actually found Python_-prefixed files --
+    # nothing past v0.2.x produces them, so the common case halves the
+    # category loop. SessionLogger writes with the bare prefix, so the
+    # absent Python_ target keys are never consumed.
+    prefixes = [""]
+    if any(pfx == "Python_" for pfx, _base in buckets):
+        prefixes.append("Python_")
 
     # Phase 1: declared channels -- full reconciliation (rename + target path).
     for prefix in prefixes:
@@ -502,7 +648,8 @@ def reconcile_session_files(sesslog_dir: Path, session_id: str, session_name: st
             key = f"{prefix}{file_type}"
             target = reconcile_single_category(
                 sesslog_dir, session_id, session_name,
-                shell, username, prefix, file_type
+                shell, username, prefix, file_type,
+                files=buckets.get((prefix, file_type), [])
             )
             if target:
                 targets[key] = target
@@ -513,7 +660,17 @@ def reconcile_session_files(sesslog_dir: Path, session_id: str, session_name: st
         for prefix in prefixes:
             reconcile_single_category(
                 sesslog_dir, session_id, session_name,
-                shell, username, prefix, basename
+                shell, username, prefix, basename,
+                files=buckets.get((prefix, basename), [])
             )
 
+    # Record the post-reconciliation directory mtime: a later call sees
+    # the same mtime only if nothing touched the directory in between.
+    try:
+        _RECONCILE_CACHE[session_id] = (
+            session_name, os.stat(sesslog_dir).st_mtime_ns, targets
+        )
+    except OSError:
+        pass
+
     return targets
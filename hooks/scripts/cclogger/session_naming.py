@@ -9,81 +9,211 @@ makes any name safe for filesystem use.
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import re
 from pathlib import Path
 from typing import Optional
 
-from dazzle_filekit import normalize_cross_platform_path
+# dazzle_filekit is imported inside the functions that need it -- see the
+# cold-start note in cclogger/debug.py's _ensure_dazzle_filekit.
 
-from cclogger.debug import debug_log
+from cclogger.debug import debug_log, get_home
+from cclogger.deferred_writes import defer_write
+
+# orjson parses several times faster than stdlib json and accepts the bytes
+# we already hold from the binary transcript read. Optional: fall back to
+# json.loads when it isn't installed.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 
 # ============================================================================
 # Session Name Detection
 # ============================================================================
 
+# Raw-bytes markers for custom-title transcript entries. Claude Code writes
+# compact JSON (no space after the colon), but tolerate the spaced variant
+# too since the old line-scan did.
+_TITLE_MARKERS = (b'"type":"custom-title"', b'"type": "custom-title"')
+
+# Targeted extraction of the customTitle value from one transcript line --
+# matches a JSON string with escaped chars allowed ((?:[^"\]|\.)*).
+_CUSTOM_TITLE_RE = re.compile(rb'"customTitle"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+def _extract_custom_title(line: bytes) -> Optional[str]:
+    """Pull customTitle out of a single transcript line.
+
+    A full json.loads parses every field of the entry just to read one;
+    the compiled regex grabs the raw string value directly and only
+    re-enters the JSON parser to decode escapes (or, on a regex miss,
+    as a whole-line fallback for unusual formatting).
+    """
+    m = _CUSTOM_TITLE_RE.search(line)
+    if m:
+        raw = m.group(1)
+        try:
+            if b"\\" in raw:
+                # Escapes present: let the JSON parser decode them
+                return _loads(b'"' + raw + b'"') or None
+            return raw.decode("utf-8") or None
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None
+    try:
+        entry = _loads(line)
+        return entry.get("customTitle") or None
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+
+def _last_custom_title(data: bytes) -> Optional[str]:
+    """Extract the LAST non-empty customTitle from raw transcript bytes.
+
+    Instead of iterating every line and json-parsing each candidate, scan
+    backwards with bytes.rfind for the custom-title marker and only decode
+    + parse the single line around the hit. Walks further back if that
+    entry has an empty/missing customTitle (matching the old loop's
+    "last non-empty title wins" semantics).
+    """
+    search_end = len(data)
+    while search_end > 0:
+        idx = max(data.rfind(marker, 0, search_end) for marker in _TITLE_MARKERS)
+        if idx < 0:
+            return None
+        line_start = data.rfind(b"\n", 0, idx) + 1
+        line_end = data.find(b"\n", idx)
+        if line_end < 0:
+            line_end = len(data)
+        title = _extract_custom_title(data[line_start:line_end])
+        if title:
+            return title
+        search_end = line_start
+    return None
+
+
+def _read_name_cache(cache_file: Path) -> dict:
+    """Read the .name-cache sidecar as a dict.
+
+    New format is JSON: {"name": ..., "mtime_ns": ..., "size": ...,
+    "last_offset": ...} where the stat fields describe the transcript as
+    of the last scan and last_offset is where the next scan resumes. Legacy
+    caches are plain text (just the name) and come back as {"name": ...}
+    with no stat fields, so they never short-circuit a scan.
+    """
+    try:
+        raw = cache_file.read_text().strip()
+    except OSError:
+        return {}
+    if not raw:
+        return {}
+    if raw.startswith("{"):
+        try:
+            cache = _loads(raw)
+            if isinstance(cache, dict):
+                return cache
+        except json.JSONDecodeError:
+            pass
+    return {"name": raw}
+
 
 def get_session_name(session_id: str, transcript_path: str) -> Optional[str]:
     """Extract user-given session name from transcript or sessions-index.json.
 
-    Always checks transcript for the LATEST custom-title entry (last one wins),
-    since sessions can be renamed multiple times via /rename or /renameAI.
-    Cache is updated when a name is found, but never used to short-circuit
-    the transcript check (to ensure renames are detected immediately).
+    Always reflects the LATEST custom-title entry (last one wins), since
+    sessions can be renamed multiple times via /rename or /renameAI.
+    The transcript scan is skipped only when the cache's recorded
+    (mtime_ns, size) matches a fresh os.stat of the transcript -- renames
+    append to the transcript, so an unchanged stat means an unchanged
+    answer and one stat syscall replaces the full-file scan.
     """
-    state_dir = Path.home() / ".claude" / "session-states"
+    state_dir = get_home() / ".claude" / "session-states"
     cache_file = state_dir / f"{session_id}.name-cache"
     session_name = None
+    cache = _read_name_cache(cache_file)
+    scanned_stat = None
 
     if transcript_path:
+        from dazzle_filekit import normalize_cross_platform_path
         transcript_file = normalize_cross_platform_path(transcript_path)
 
-        # Method 1: Check transcript .jsonl for custom-title entries
-        # Iterate through ALL entries - last one wins (most recent rename)
-        if transcript_file.exists():
-            try:
-                with open(transcript_file, "r", encoding="utf-8") as f:
-                    for line in f:
-                        if '"type":"custom-title"' in line or '"type": "custom-title"' in line:
-                            try:
-                                entry = json.loads(line)
-                                if entry.get("customTitle"):
-                                    session_name = entry["customTitle"]
-                            except json.JSONDecodeError:
-                                pass
-            except Exception:
-                pass
+        # Method 1: Check transcript .jsonl for custom-title entries.
+        # Last one wins (most recent rename) -- located via a backwards
+        # bytes scan so only the matching line pays for a JSON parse.
+        try:
+            st = os.stat(transcript_file)
+        except OSError:
+            st = None
+        if st is not None:
+            if (cache.get("mtime_ns") == st.st_mtime_ns
+                    and cache.get("size") == st.st_size):
+                # Transcript unchanged since last scan -- cached answer holds
+                if cache.get("name"):
+                    return cache["name"]
+                # Cached "no title in transcript": skip the scan but still
+                # try the fallbacks below
+            else:
+                # Transcripts grow append-only, so only the bytes past the
+                # last scanned offset need reading (O(delta) per hook, not
+                # O(file size)). Reset to a full scan if the transcript
+                # shrank (truncation/rewrite) or no offset was recorded.
+                offset = cache.get("last_offset")
+                if not isinstance(offset, int) or offset < 0 or offset > st.st_size:
+                    offset = 0
+                try:
+                    with open(transcript_file, "rb") as f:
+                        if offset:
+                            f.seek(offset)
+                        tail_name = _last_custom_title(f.read())
+                    if tail_name:
+                        session_name = tail_name
+                    elif offset:
+                        # No new title in the appended tail; the previous
+                        # scan's answer (cached name, possibly none) stands
+                        session_name = cache.get("name")
+                    scanned_stat = st
+                except Exception:
+                    pass
 
         # Method 2: Fallback to sessions-index.json (if no custom-title in transcript)
         if not session_name:
             sessions_index = transcript_file.parent / "sessions-index.json"
-            if sessions_index.exists():
+            try:
+                index_bytes = sessions_index.read_bytes()
+            except OSError:
+                index_bytes = b""
+            # Cheap membership probe before parsing: right after session
+            # start the id usually isn't in the index yet, and a bytes.find
+            # miss skips the full JSON parse of a potentially large index
+            if index_bytes and session_id.encode("utf-8") in index_bytes:
                 try:
-                    with open(sessions_index, "r", encoding="utf-8") as f:
-                        index_data = json.load(f)
-                        for entry in index_data.get("entries", []):
-                            if entry.get("sessionId") == session_id:
-                                session_name = entry.get("customTitle")
-                                break
+                    index_data = _loads(index_bytes)
+                    for entry in index_data.get("entries", []):
+                        if entry.get("sessionId") == session_id:
+                            session_name = entry.get("customTitle")
+                            break
                 except Exception:
                     pass
 
     # Method 3: Fallback to cache (if transcript/index reads failed)
-    if not session_name and cache_file.exists():
-        try:
-            cached_name = cache_file.read_text().strip()
-            if cached_name:
-                session_name = cached_name
-        except Exception:
-            pass
-
-    # Update cache with latest name (for debugging/inspection)
-    if session_name:
-        try:
-            cache_file.write_text(session_name)
-        except Exception:
-            pass
+    if not session_name and cache.get("name"):
+        session_name = cache["name"]
+
+    # Update cache with latest name + transcript stat. The stat fields
+    # enable the short-circuit above; the name doubles as the Method 3
+    # fallback and stays inspectable for debugging.
+    if session_name or scanned_stat is not None:
+        payload: dict = {"name": session_name}
+        if scanned_stat is not None:
+            payload["mtime_ns"] = scanned_stat.st_mtime_ns
+            payload["size"] = scanned_stat.st_size
+            payload["last_offset"] = scanned_stat.st_size
+        # Deferred: flushed at process exit, coalesced with other sidecars
+        defer_write(cache_file, json.dumps(payload).encode("utf-8"))
 
     return session_name
 
@@ -102,13 +232,34 @@ GENERIC_FOLDER_NAMES = {
 DRIVE_LETTERS = {"c", "d", "e", "f", "g", "h", "z"}
 
 
+# Compiled once at module scope: derive_session_name_from_cwd calls
+# _sanitize_folder_name up to 4x per SessionStart, and folder names repeat
+# across hook invocations (hence the lru_cache on top).
+_FOLDER_BAD_RE = re.compile(r'[^a-zA-Z0-9_-]')
+_FOLDER_DASHES_RE = re.compile(r'-+')
+
+# sanitize_dirname: Windows/Unix-reserved characters and control
+# characters, folded into one compiled pattern (was two re.sub passes).
+_DIRNAME_BAD_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
+# ASCII fast path: a single C-level str.translate pass maps every invalid
+# character to '-'. Non-ASCII names (outside the table) take the regex path.
+_FOLDER_TRANSLATE = {
+    c: ord('-') for c in range(128)
+    if not (chr(c).isalnum() or chr(c) in '_-')
+}
+
+
+@functools.lru_cache(maxsize=256)
 def _sanitize_folder_name(name: str) -> str:
     """Sanitize a folder name for use in session names."""
-    import re
-    # Remove special chars, replace spaces/underscores with hyphens
-    sanitized = re.sub(r'[^a-zA-Z0-9_-]', '-', name.lower())
-    sanitized = re.sub(r'-+', '-', sanitized)  # Collapse multiple hyphens
-    return sanitized.strip('-')
+    lowered = name.lower()
+    if lowered.isascii():
+        sanitized = lowered.translate(_FOLDER_TRANSLATE)
+    else:
+        sanitized = _FOLDER_BAD_RE.sub('-', lowered)
+    # Collapse runs of hyphens
+    return _FOLDER_DASHES_RE.sub('-', sanitized).strip('-')
 
 
 def derive_session_name_from_cwd(cwd: str) -> Optional[str]:
@@ -132,6 +283,7 @@ def derive_session_name_from_cwd(cwd: str) -> Optional[str]:
     if not cwd:
         return None
 
+    from dazzle_filekit import normalize_cross_platform_path
     path = normalize_cross_platform_path(cwd)
 
     # Use path.parts to get all components including drive letter
@@ -143,30 +295,40 @@ def derive_session_name_from_cwd(cwd: str) -> Optional[str]:
         path_str = str(path).replace('\\', '/')
         all_parts = [p for p in path_str.split('/') if p]
 
-    # Collect last 4 meaningful parts with metadata
-    parts = []  # List of (sanitized, raw, is_drive) tuples
-    for part in all_parts[-4:]:
+    tail_parts = all_parts[-4:]
+
+    # Strategy 1: If current folder is non-generic (and not a drive
+    # letter), use it alone. Walk back to the last component with a
+    # usable name and test only that one -- the common case then returns
+    # without sanitizing the remaining parts or building any metadata.
+    last_idx = None
+    for i in range(len(tail_parts) - 1, -1, -1):
         # Clean up drive letter format (e.g., "C:\\" -> "C", "C:" -> "C")
-        raw = part.rstrip(':\\/')
+        raw = tail_parts[i].rstrip(':\\/')
         sanitized = _sanitize_folder_name(raw)
         if sanitized:
-            is_drive = sanitized in DRIVE_LETTERS
-            parts.append((sanitized, raw.lower(), is_drive))
+            last_idx = i
+            if (raw.lower() not in GENERIC_FOLDER_NAMES and
+                sanitized not in DRIVE_LETTERS and
+                len(sanitized) >= 3):
+                debug_log(f"Using current folder name: '{sanitized}'")
+                return sanitized[:50]
+            break
 
-    if not parts:
+    if last_idx is None:
         debug_log("No usable path parts found")
         return None
 
-    # Strategy 1: If current folder is non-generic (and not a drive letter), use it alone
-    current_name, current_raw, current_is_drive = parts[-1]
-    if (current_raw not in GENERIC_FOLDER_NAMES and
-        not current_is_drive and
-        len(current_name) >= 3):
-        debug_log(f"Using current folder name: '{current_name}'")
-        return current_name[:50]
-
     # Strategy 2: Find the nearest non-generic ancestor (excluding drive letters),
-    # then use path from there down (including drive letter if it's the start)
+    # then use path from there down (including drive letter if it's the start).
+    # Only this fallback path pays for sanitizing the remaining components.
+    parts = []  # List of (sanitized, raw, is_drive) tuples
+    for part in tail_parts[:last_idx + 1]:
+        raw = part.rstrip(':\\/')
+        sanitized = _sanitize_folder_name(raw)
+        if sanitized:
+            parts.append((sanitized, raw.lower(), sanitized in DRIVE_LETTERS))
+
     start_idx = 0
     for i in range(len(parts) - 2, -1, -1):  # Start from second-to-last, go to 0
         _, raw, is_drive = parts[i]
@@ -229,11 +391,13 @@ def apply_auto_name_on_session_start(
         return None
 
     # Store in cache file so subsequent hooks pick it up
-    state_dir = Path.home() / ".claude" / "session-states"
+    state_dir = get_home() / ".claude" / "session-states"
     state_dir.mkdir(parents=True, exist_ok=True)
     cache_file = state_dir / f"{session_id}.name-cache"
 
     try:
+        # Synchronous on purpose (not defer_write): build_session_context
+        # re-reads the cache file later in this same SessionStart hook
         cache_file.write_text(auto_name)
         debug_log(f"Applied auto-name '{auto_name}' for session {session_id}")
         return auto_name
@@ -254,9 +418,6 @@ def sanitize_dirname(name: str, max_len: int = 200) -> str:
     Returns:
         Filesystem-safe version of the name
     """
-    # Replace characters that are problematic on Windows/Unix filesystems
-    safe = re.sub(r'[<>:"/\\|?*]', '_', name)
-    # Also replace any control characters
-    safe = re.sub(r'[\x00-\x1f]', '_', safe)
-    # Truncate to max length
-    return safe[:max_len]
+    # Replace problematic filesystem characters + control characters
+    # (single combined pass), then truncate to max length
+    return _DIRNAME_BAD_RE.sub('_', name)[:max_len]
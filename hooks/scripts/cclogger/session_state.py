@@ -10,17 +10,35 @@ from __future__ import annotations
 
 import json
 import os
-import subprocess
+import stat
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
-from dazzle_filekit import normalize_cross_platform_path, create_symlink
+# dazzle_filekit and subprocess are imported inside the functions that need
+# them: hooks are short-lived processes, so keeping them off the module
+# import path shaves cold-start on invocations that never hit those paths.
 
-from cclogger.debug import debug_log
+from cclogger.debug import debug_log, get_home
+from cclogger.deferred_writes import defer_write
 from cclogger.models import SessionContext, ToolInfo
 from cclogger.session_naming import get_session_name
 
+# orjson serializes/parses the session-state JSON several times faster than
+# stdlib json. Optional dependency: fall back to the stdlib when missing.
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps_indent(obj: dict) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps_indent(obj: dict) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 
 # ============================================================================
 # Session State File Management
@@ -31,6 +49,7 @@ def get_sessions_index_path(transcript_path: str) -> Optional[str]:
     """Get the sessions-index.json path from transcript path."""
     if not transcript_path:
         return None
+    from dazzle_filekit import normalize_cross_platform_path
     transcript_file = normalize_cross_platform_path(transcript_path)
     sessions_index = transcript_file.parent / "sessions-index.json"
     if sessions_index.exists():
@@ -50,18 +69,19 @@ def write_session_state(
     This enables commands (like /renameAI) to access session context
     that is only authoritatively available to hooks.
     """
-    state_dir = Path.home() / ".claude" / "session-states"
+    state_dir = get_home() / ".claude" / "session-states"
     state_dir.mkdir(parents=True, exist_ok=True)
     state_file = state_dir / f"{session_id}.json"
 
     # Preserve original_cwd from existing state (set once, never changes)
     original_cwd = cwd
+    existing = None
     if state_file.exists():
         try:
-            existing = json.loads(state_file.read_text())
+            existing = _loads(state_file.read_bytes())
             original_cwd = existing.get("original_cwd", existing.get("cwd", cwd))
         except Exception:
-            pass
+            existing = None
 
     state = {
         "session_id": session_id,
@@ -71,24 +91,29 @@ def write_session_state(
         "original_cwd": original_cwd,
         "cwd": cwd,
         "current_name": current_name,
-        "updated_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        # strftime emits the Z-suffixed form directly -- same output as the
+        # old isoformat().replace("+00:00", "Z") chain minus two string copies
+        "updated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
     }
-    # Atomic write: write to temp file, then rename
-    temp_file = state_file.with_suffix(".tmp")
-    try:
-        temp_file.write_text(json.dumps(state, indent=2))
-        temp_file.replace(state_file)
-        debug_log(f"Wrote session state to {state_file}")
-    except Exception as e:
-        debug_log(f"Failed to write session state: {e}")
+    # Most hook calls change nothing but updated_at -- skip the rewrite
+    # (and its temp-file + replace syscalls) when the rest is identical
+    if existing is not None:
+        if ({k: v for k, v in existing.items() if k != "updated_at"}
+                == {k: v for k, v in state.items() if k != "updated_at"}):
+            return
+
+    # Queue the write; deferred_writes flushes once at process exit
+    # (atomic temp + replace), coalescing with any other sidecar updates
+    defer_write(state_file, _dumps_indent(state))
+    debug_log(f"Queued session state write to {state_file}")
 
 
 def read_session_state(session_id: str) -> Optional[dict]:
     """Read session state from ~/.claude/session-states/{session_id}.json."""
-    state_file = Path.home() / ".claude" / "session-states" / f"{session_id}.json"
+    state_file = get_home() / ".claude" / "session-states" / f"{session_id}.json"
     if state_file.exists():
         try:
-            return json.loads(state_file.read_text())
+            return _loads(state_file.read_bytes())
         except Exception as e:
             debug_log(f"Failed to read session state: {e}")
     return None
@@ -115,11 +140,30 @@ def ensure_transcript_symlink(sesslog_dir: Path, transcript_path: str) -> bool:
 
     symlink_path = sesslog_dir / "transcript.jsonl"
 
-    # Check if symlink already exists and points to the right target
-    if symlink_path.is_symlink():
+    # One lstat replaces the old is_symlink() + exists() round-trips:
+    # ENOENT means go straight to creation, S_ISLNK means inspect the
+    # target, anything else is a real file/dir squatting on the path.
+    # (A bare EAFP os.symlink won't do here: wrong-target links must be
+    # recreated, and creation itself needs dazzle-filekit's Windows
+    # fallback chain, so the probe has to stay.)
+    try:
+        existing_mode = os.lstat(symlink_path).st_mode
+    except OSError:
+        existing_mode = None
+
+    if existing_mode is not None:
+        if not stat.S_ISLNK(existing_mode):
+            debug_log(f"Cannot create symlink - regular file exists: {symlink_path}")
+            return False
         try:
             existing_target = os.readlink(symlink_path)
+            # Byte-identical target -- the overwhelmingly common steady
+            # state -- needs no normalization round-trip (or the
+            # dazzle_filekit import that comes with it).
+            if existing_target == transcript_path:
+                return True
             # Normalize paths for comparison
+            from dazzle_filekit import normalize_cross_platform_path
             transcript_normalized = normalize_cross_platform_path(transcript_path)
             existing_normalized = normalize_cross_platform_path(existing_target)
             if transcript_normalized == existing_normalized:
@@ -132,10 +176,7 @@ def ensure_transcript_symlink(sesslog_dir: Path, transcript_path: str) -> bool:
             debug_log(f"Error checking existing symlink: {e}")
             return False
 
-    # Skip if regular file exists at symlink path
-    if symlink_path.exists() and not symlink_path.is_symlink():
-        debug_log(f"Cannot create symlink - regular file exists: {symlink_path}")
-        return False
+    from dazzle_filekit import normalize_cross_platform_path, create_symlink
 
     # Normalize the transcript path
     transcript_file = normalize_cross_platform_path(transcript_path)
@@ -183,8 +224,26 @@ def detect_shell_type() -> str:
     return "unknown"
 
 
+# detect_tmux_session result, cached after the first successful lookup --
+# the pane's session name doesn't change within one hook invocation.
+_tmux_session_cache: Optional[str] = None
+
+
 def detect_tmux_session() -> Optional[str]:
-    """Detect tmux session name if running in tmux."""
+    """Detect tmux session name if running in tmux.
+
+    The tmux server sets $TMUX inside every pane, so its absence is a
+    reliable negative -- skip the fork+exec entirely in that (common)
+    case instead of paying for a subprocess with a 1s timeout.
+    """
+    if not os.environ.get("TMUX"):
+        return None
+
+    global _tmux_session_cache
+    if _tmux_session_cache is not None:
+        return _tmux_session_cache
+
+    import subprocess
     try:
         result = subprocess.run(
             ["tmux", "display-message", "-p", "#S"],
@@ -193,7 +252,8 @@ def detect_tmux_session() -> Optional[str]:
             timeout=1,
         )
         if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip()
+            _tmux_session_cache = result.stdout.strip()
+            return _tmux_session_cache
     except Exception:
         pass
     return None
@@ -31,8 +31,9 @@ sys.path.insert(0, str(Path(__file__).resolve().parent))
 from cclogger.categorize import categorize_tool
 from cclogger.config import ConfigLoader
 from cclogger.conversation import handle_conversation_event
-from cclogger.debug import DEBUG_LOG, _warn_unknown_tool_once, debug_log
+from cclogger.debug import DEBUG_LOG, _warn_unknown_tool_once, debug_log, get_home
 from cclogger.failure_detection import detect_and_log_failure
+from cclogger.file_io import ensure_dir
 from cclogger.formatters import (
     generate_entry,
     get_command_content_structured,
@@ -41,7 +42,7 @@ from cclogger.formatters import (
 )
 from cclogger.logger import SessionLogger
 from cclogger.models import ToolInfo
-from cclogger.reconciliation import reconcile_session_directory
+from cclogger.reconciliation import build_session_directory, reconcile_session_directory
 from cclogger.session_naming import apply_auto_name_on_session_start
 from cclogger.session_state import (
     build_session_context,
@@ -62,7 +63,6 @@ def main() -> None:
     event_time = datetime.now()
 
     debug_log("Hook started (Python)")
-    debug_log(f"JSON keys will be logged after parse")
 
     # Read JSON input from stdin (explicitly decode as UTF-8 for Windows compatibility)
     # On Windows, sys.stdin defaults to CP1252, but Claude sends UTF-8
@@ -74,7 +74,10 @@ def main() -> None:
         print('{"continue": true}')
         return
 
-    debug_log(f"JSON_INPUT length: {len(str(json_input))}")
+    # Raw byte length, not len(str(json_input)) -- stringifying the whole
+    # payload dict just to measure it re-serialized arbitrarily large tool
+    # inputs on every hook.
+    debug_log(f"JSON_INPUT length: {len(raw_input)}")
     debug_log(f"JSON keys: {list(json_input.keys())}")
 
     # Log additional details to help investigate agent context (#5)
@@ -84,8 +87,9 @@ def main() -> None:
         if key in json_input:
             debug_log(f"Agent investigation - {key}: {json_input[key]}")
 
-    # Detect hook event type
+    # Detect hook event type; pull cwd once for the call sites below
     hook_event_name = json_input.get("hook_event_name", "PostToolUse")
+    cwd = json_input.get("cwd", "")
     debug_log(f"Hook event: {hook_event_name}")
 
     # Log source field for SessionStart events to investigate compaction detection (#14)
@@ -102,7 +106,7 @@ def main() -> None:
     auto_name = apply_auto_name_on_session_start(
         session_id=tool_info.session_id,
         transcript_path=tool_info.transcript_path,
-        cwd=json_input.get("cwd", ""),
+        cwd=cwd,
         hook_event_name=hook_event_name
     )
     if auto_name:
@@ -112,7 +116,7 @@ def main() -> None:
     # writes a fresh SESSION START marker with correct run number
     # (fixes #9 - session resume detection)
     if hook_event_name == "SessionStart":
-        state_dir = Path.home() / ".claude" / "session-states"
+        state_dir = get_home() / ".claude" / "session-states"
         state_dir.mkdir(parents=True, exist_ok=True)
         source = json_input.get("source", "unknown")
         # Clear .started flag so marker gets written
@@ -121,11 +125,24 @@ def main() -> None:
         source_file = state_dir / f"{tool_info.session_id}.source"
         try:
             started_flag.unlink(missing_ok=True)
-            # Only clear .run cache for true session starts, not compactions (#14)
+            # Only advance the .run cache for true session starts, not
+            # compactions (#14). Increment in place rather than deleting:
+            # a deleted .run forces get_run_number to recount markers in
+            # the unified log (an O(file-size) scan) on the next hook,
+            # while +1 on the cached value is exact -- one marker is
+            # written per run, so marker_count + 1 == last_run + 1. The
+            # recount path survives as the fallback for a missing or
+            # corrupted cache file.
             if source != "compact":
                 run_cache = state_dir / f"{tool_info.session_id}.run"
-                run_cache.unlink(missing_ok=True)
-                debug_log(f"Cleared .started/.run flags, saved source={source}")
+                try:
+                    next_run = int(run_cache.read_text().strip()) + 1
+                    run_cache.write_text(str(next_run))
+                    debug_log(f"Advanced .run to {next_run}, cleared .started, saved source={source}")
+                except (OSError, ValueError):
+                    # No/unreadable cache -- recount from markers next hook
+                    run_cache.unlink(missing_ok=True)
+                    debug_log(f"Cleared .started/.run flags, saved source={source}")
             else:
                 debug_log(f"Cleared .started flag (compaction, .run preserved), saved source={source}")
             # Write source value for next PostToolUse to read
@@ -151,30 +168,45 @@ def main() -> None:
     is_tool_hook = hook_event_name in ("PostToolUse", "PreToolUse", "PostToolUseFailure")
 
     # Create sesslog directory structure (needed for state file)
-    sesslog_base = Path.home() / ".claude" / "sesslogs"
-    sesslog_base.mkdir(parents=True, exist_ok=True)
-
-    # Get or create session directory
-    # This handles renames if session name changed (e.g., after /rename)
-    session_dir, _ = reconcile_session_directory(
-        sesslog_base,
-        tool_info.session_id,
-        session_context.session_name,
-        session_context.username
-    )
+    sesslog_base = get_home() / ".claude" / "sesslogs"
+    ensure_dir(sesslog_base)
+
+    # Get or create session directory.
+    # This handles renames if session name changed (e.g., after /rename).
+    # Only tool hooks and SessionStart (where auto-naming may have just
+    # assigned a name) pay for the reconcile + symlink machinery. Other
+    # non-tool hooks (Stop, UserPromptSubmit, ...) exit right after the
+    # state write; conversation events construct their own SessionLogger,
+    # which reconciles anyway, so doing it here too was pure duplication.
+    if is_tool_hook or hook_event_name == "SessionStart":
+        session_dir, _ = reconcile_session_directory(
+            sesslog_base,
+            tool_info.session_id,
+            session_context.session_name,
+            session_context.username
+        )
+        # Create transcript symlink in sesslog directory (non-blocking on failure)
+        ensure_transcript_symlink(session_dir, tool_info.transcript_path)
+    else:
+        # Expected path from the current name -- pure string work. For a
+        # running session this is where the directory already lives; if a
+        # rename is pending, the next tool hook reconciles and rewrites
+        # the state with the final path.
+        session_dir = sesslog_base / build_session_directory(
+            session_context.session_name,
+            tool_info.session_id,
+            session_context.username,
+        )
 
     # Write session state file (enables commands like /renameAI to access context)
     write_session_state(
         session_id=tool_info.session_id,
         transcript_path=tool_info.transcript_path,
-        cwd=json_input.get("cwd", ""),
+        cwd=cwd,
         sesslog_dir=session_dir,
         current_name=session_context.session_name,
     )
 
-    # Create transcript symlink in sesslog directory (non-blocking on failure)
-    ensure_transcript_symlink(session_dir, tool_info.transcript_path)
-
     # Conversation events (sub-issues #33-#35): UserPromptSubmit, Stop,
     # SubagentStop -- capture user/AI/agent prose to the convo channel
     # before the non-tool early-exit below.
@@ -233,12 +265,15 @@ def main() -> None:
         )
 
     # Create logger and write entry (pass event_time for channel consistency)
-    # SessionLogger handles file reconciliation and session markers on init
-    logger = SessionLogger(config, session_context, event_time)
+    # SessionLogger handles file reconciliation and session markers on init;
+    # passing the already-reconciled session_dir skips a second directory
+    # reconcile pass when the names agree.
+    logger = SessionLogger(config, session_context, event_time, session_dir=session_dir)
     logger.log_entry(entry, tool_info.name, tool_category, event_time=event_time, raw_json=tool_info.raw_json)
 
-    # Check for failures (Bash only, uses same event_time)
-    detect_and_log_failure(tool_info, config, logger, event_time)
+    # Check for failures (Bash only, uses same event_time; cwd from the
+    # payload spares the hook an os.getcwd() syscall)
+    detect_and_log_failure(tool_info, config, logger, event_time, cwd=cwd)
 
     debug_log(f"Logged to {logger.shell_log_path}")
 
@@ -12,6 +12,8 @@ This script:
 """
 
 import json
+import os
+import shutil
 import sys
 import re
 from datetime import datetime, timezone
@@ -19,11 +21,34 @@ from pathlib import Path
 
 # Import dazzle-filekit for cross-platform operations
 try:
-    from dazzle_filekit import copy_file, normalize_cross_platform_path
+    from dazzle_filekit import normalize_cross_platform_path
     HAS_FILEKIT = True
 except ImportError:
     HAS_FILEKIT = False
-    import shutil
+
+# orjson parses/serializes the sessions index several times faster than
+# stdlib json -- the index covers every session, so it can get large.
+# Optional dependency: fall back to the stdlib when missing.
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps_indent(obj: dict) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps_indent(obj: dict) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
+# Compiled once at import: re's internal cache is bounded and shared, and
+# sanitize runs all four passes per rename.
+_COLON_SLASH_RE = re.compile(r'[:/\\]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_UNSAFE_RE = re.compile(r'[^a-z0-9_-]')
+_MULTI_SEP_RE = re.compile(r'[-_]{2,}')
 
 
 def sanitize_session_name(name: str, max_words: int = 10) -> str:
@@ -44,16 +69,16 @@ def sanitize_session_name(name: str, max_words: int = 10) -> str:
     name = name.lower()
 
     # Replace colons/slashes with dashes (same-concept separator)
-    name = re.sub(r'[:/\\]', '-', name)
+    name = _COLON_SLASH_RE.sub('-', name)
 
     # Replace spaces with underscores (word separator)
-    name = re.sub(r'\s+', '_', name)
+    name = _WHITESPACE_RE.sub('_', name)
 
     # Remove unsafe characters, keep alphanumeric, dash, underscore
-    name = re.sub(r'[^a-z0-9_-]', '', name)
+    name = _UNSAFE_RE.sub('', name)
 
     # Collapse multiple separators
-    name = re.sub(r'[-_]{2,}', '_', name)
+    name = _MULTI_SEP_RE.sub('_', name)
 
     # Trim leading/trailing separators
     name = name.strip('-_')
@@ -61,8 +86,7 @@ def sanitize_session_name(name: str, max_words: int = 10) -> str:
     # Limit words (split on underscore, take first N, rejoin)
     words = name.split('_')
     if len(words) > max_words:
-        words = words[:max_words]
-    name = '_'.join(words)
+        name = '_'.join(words[:max_words])
 
     return name
 
@@ -74,37 +98,12 @@ def normalize_path(path_str: str) -> Path:
     return Path(path_str)
 
 
-def create_backup(file_path: Path) -> Path:
-    """Create timestamped backup of a file using system-level copy.
-
-    Uses dazzle-filekit's copy_file() which preserves permissions via
-    robocopy on Windows and shutil.copy2 on Unix.
-
-    Returns the backup path.
-    """
-    timestamp = datetime.now().strftime("%Y-%m-%d__%H-%M-%S")
-    backup_path = file_path.with_suffix(f".json.{timestamp}.bak")
-
-    if file_path.exists():
-        if HAS_FILEKIT:
-            # Use dazzle-filekit for system-level copy with attribute preservation
-            success = copy_file(file_path, backup_path, preserve_attrs=True, overwrite=False)
-            if success:
-                print(f"Created backup: {backup_path.name}")
-            else:
-                print(f"Warning: Backup creation failed, falling back to text copy")
-                backup_path.write_text(file_path.read_text(encoding='utf-8'), encoding='utf-8')
-                print(f"Created backup (text): {backup_path.name}")
-        else:
-            # Fallback: use shutil.copy2 which preserves metadata
-            shutil.copy2(file_path, backup_path)
-            print(f"Created backup: {backup_path.name}")
-
-    return backup_path
-
-
 def update_sessions_index(sessions_index_path: Path, session_id: str, new_name: str) -> bool:
-    """Update the customTitle in sessions-index.json.
+    """Update the customTitle in sessions-index.json, backing it up first.
+
+    The index is read exactly once: the same bytes feed both the
+    timestamped backup and the in-memory parse, instead of a copy-based
+    backup re-reading the whole file before the update does.
 
     Returns True if successful, False otherwise.
     """
@@ -113,8 +112,25 @@ def update_sessions_index(sessions_index_path: Path, session_id: str, new_name:
         return False
 
     try:
-        data = json.loads(sessions_index_path.read_text(encoding='utf-8'))
-    except json.JSONDecodeError as e:
+        data_bytes = sessions_index_path.read_bytes()
+    except OSError as e:
+        print(f"Error reading sessions-index.json: {e}")
+        return False
+
+    # Timestamped backup from the bytes already in memory; copystat
+    # carries over permissions/mtime like the old copy-based backup did.
+    timestamp = datetime.now().strftime("%Y-%m-%d__%H-%M-%S")
+    backup_path = sessions_index_path.with_suffix(f".json.{timestamp}.bak")
+    try:
+        backup_path.write_bytes(data_bytes)
+        shutil.copystat(sessions_index_path, backup_path)
+        print(f"Created backup: {backup_path.name}")
+    except OSError as e:
+        print(f"Warning: Backup creation failed: {e}")
+
+    try:
+        data = _loads(data_bytes)
+    except ValueError as e:
         print(f"Error parsing sessions-index.json: {e}")
         return False
 
@@ -132,8 +148,15 @@ def update_sessions_index(sessions_index_path: Path, session_id: str, new_name:
         print("The session may be too new. Proceeding with transcript update only.")
         return True  # Not fatal - transcript update may still work
 
-    # Write back
-    sessions_index_path.write_text(json.dumps(data, indent=2), encoding='utf-8')
+    # Write back atomically: temp sibling + os.replace, so a crash
+    # mid-write can't leave a truncated index behind.
+    tmp_path = sessions_index_path.with_name(sessions_index_path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(_dumps_indent(data))
+        os.replace(tmp_path, sessions_index_path)
+    except OSError as e:
+        print(f"Error writing sessions-index.json: {e}")
+        return False
     print(f"Updated sessions-index.json: customTitle = {new_name}")
     return True
 
@@ -223,11 +246,7 @@ def main():
     print(f"Transcript: {transcript_path}")
     print()
 
-    # Create backup of sessions-index.json
-    if sessions_index_path.exists():
-        create_backup(sessions_index_path)
-
-    # Update sessions-index.json
+    # Back up + update sessions-index.json (one read feeds both)
     index_ok = update_sessions_index(sessions_index_path, session_id, new_name)
 
     # Update transcript
@@ -12,6 +12,7 @@ import argparse
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -41,7 +42,6 @@ def install(check_only: bool = False, force: bool = False) -> bool:
     if check_only:
         print("Files to install:")
         for src_rel, dst_rel in files:
-            src = script_dir / src_rel
             dst = claude_dir / dst_rel
             exists = dst.exists()
             status = " (exists, will skip)" if exists and not force else ""
@@ -55,25 +55,34 @@ def install(check_only: bool = False, force: bool = False) -> bool:
     (claude_dir / "hooks").mkdir(parents=True, exist_ok=True)
     (claude_dir / "commands").mkdir(parents=True, exist_ok=True)
 
-    installed = 0
-    skipped = 0
-
-    for src_rel, dst_rel in files:
+    # Copy in parallel -- per-file open/read/write/setstat overhead
+    # dominates for these small files (especially on Windows), so
+    # overlapping the copies across a few threads hides most of it.
+    # Each worker returns (status, message); printing happens afterwards
+    # in the original file order so output stays deterministic.
+    def _copy_one(file_pair: tuple) -> tuple:
+        src_rel, dst_rel = file_pair
         src = script_dir / src_rel
         dst = claude_dir / dst_rel
 
         if not src.exists():
-            print(f"  ERROR: Source file not found: {src}")
-            continue
-
+            return ("error", f"  ERROR: Source file not found: {src}")
         if dst.exists() and not force:
-            print(f"  SKIP: {dst_rel} (exists, use --force to overwrite)")
-            skipped += 1
-            continue
-
+            return ("skip", f"  SKIP: {dst_rel} (exists, use --force to overwrite)")
         shutil.copy2(src, dst)
-        print(f"  OK: {dst_rel}")
-        installed += 1
+        return ("ok", f"  OK: {dst_rel}")
+
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        results = list(ex.map(_copy_one, files))
+
+    installed = 0
+    skipped = 0
+    for status, message in results:
+        print(message)
+        if status == "ok":
+            installed += 1
+        elif status == "skip":
+            skipped += 1
 
     print()
     print(f"Installed: {installed}, Skipped: {skipped}")
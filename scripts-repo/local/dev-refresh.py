@@ -30,6 +30,8 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
+import os
 import re
 import shutil
 import sys
@@ -40,12 +42,22 @@ from pathlib import Path
 # DazzleML marketplace namespace. If the plugin moves marketplaces or
 # Claude Code changes its caching scheme, update these constants.
 PLUGIN_NAME = "session-logger@dazzle-claude-plugins"
-PLUGIN_CACHE_PATH = (
-    Path.home() / ".claude" / "plugins" / "cache" / "dazzle-claude-plugins" / "session-logger"
-)
 VERSION_SOURCE = "version.py"
 
 
+@functools.lru_cache(maxsize=1)
+def plugin_cache_path() -> Path:
+    """Cache root for this plugin's installed versions.
+
+    Built lazily: Path.home() goes through the Shell API on Windows, so
+    don't pay for it at import time (e.g. when --help exits early).
+    """
+    return (
+        Path.home() / ".claude" / "plugins" / "cache"
+        / "dazzle-claude-plugins" / "session-logger"
+    )
+
+
 def find_repo_root(start: Path) -> Path:
     """Walk up from start looking for the version source file."""
     cur = start.resolve()
@@ -71,33 +83,56 @@ def read_current_version(root: Path) -> str:
     return f"{major.group(1)}.{minor.group(1)}.{patch.group(1)}"
 
 
-def clear_version(version: str, dry_run: bool, force: bool) -> int:
-    """Remove a single version's cache directory.
+def collect_targets(versions: list[str]) -> list[tuple[str, Path, int]]:
+    """Build the removal plan: (version, cache path, file count) per
+    version whose cache directory exists.
 
-    Returns: 0 on success or "nothing to clear", non-zero on failure.
+    Versions with no cache directory print their "nothing to clear" note
+    here and are left out of the plan. The count comes from os.walk,
+    which gets file/dir classification from readdir itself -- rglob +
+    is_file() paid an extra stat per entry for this display-only number.
+    A count of -1 means the walk failed; the path is still removable.
     """
-    cache_version_path = PLUGIN_CACHE_PATH / version
+    targets = []
+    for version in versions:
+        path = plugin_cache_path() / version
+        if not path.exists():
+            print(f"  Cache {version}/ does not exist (nothing to clear)")
+            continue
+        try:
+            file_count = sum(len(files) for _, _, files in os.walk(path))
+        except Exception:
+            file_count = -1
+        targets.append((version, path, file_count))
+    return targets
 
-    if not cache_version_path.exists():
-        print(f"  Cache {version}/ does not exist (nothing to clear)")
-        return 0
 
-    print(f"\n  Plugin cache to remove:")
-    print(f"    Path: {cache_version_path}")
+def remove_targets(
+    targets: list[tuple[str, Path, int]], dry_run: bool, force: bool
+) -> int:
+    """Show the combined plan, confirm once, then remove the directories.
 
-    try:
-        file_count = sum(1 for _ in cache_version_path.rglob("*") if _.is_file())
-        print(f"    Contains: {file_count} file(s)")
-    except Exception:
-        pass
+    One summary + one prompt replaces the old per-version prompt loop;
+    with several versions the rmtrees run on a small thread pool (rmtree
+    is syscall-bound, so the threads overlap real I/O).
+
+    Returns: 0 on success or nothing to do, non-zero if any removal failed.
+    """
+    if not targets:
+        return 0
+
+    print(f"\n  Plugin cache to remove ({len(targets)} directory(ies)):")
+    for version, path, file_count in targets:
+        suffix = f"  ({file_count} file(s))" if file_count >= 0 else ""
+        print(f"    {path}{suffix}")
 
     if dry_run:
-        print(f"  [DRY] Would remove this directory")
+        print("  [DRY] Would remove these directories")
         return 0
 
     if not force:
         try:
-            confirm = input(f"\n  Delete {cache_version_path}? [y/N]: ")
+            confirm = input(f"\n  Delete all {len(targets)} of the above? [y/N]: ")
             if confirm.lower() not in ("y", "yes"):
                 print("  Skipped (no confirmation)")
                 return 0
@@ -105,13 +140,29 @@ def clear_version(version: str, dry_run: bool, force: bool) -> int:
             print("\n  Skipped (interrupted)")
             return 0
 
-    try:
-        shutil.rmtree(cache_version_path)
-        print(f"  Cleared cache: {version}/")
-        return 0
-    except Exception as e:
-        print(f"  Warning: Could not remove cache {version}/: {e}", file=sys.stderr)
-        return 1
+    def _remove(target: tuple[str, Path, int]):
+        version, path, _ = target
+        try:
+            shutil.rmtree(path)
+            return version, None
+        except Exception as e:
+            return version, e
+
+    if len(targets) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(4, len(targets))) as ex:
+            results = list(ex.map(_remove, targets))
+    else:
+        results = [_remove(targets[0])]
+
+    overall = 0
+    for version, error in results:
+        if error is None:
+            print(f"  Cleared cache: {version}/")
+        else:
+            print(f"  Warning: Could not remove cache {version}/: {error}", file=sys.stderr)
+            overall = 1
+    return overall
 
 
 def main() -> int:
@@ -155,14 +206,11 @@ def main() -> int:
             return 1
 
     print(f"Plugin: {PLUGIN_NAME}")
-    print(f"Cache root: {PLUGIN_CACHE_PATH}")
+    print(f"Cache root: {plugin_cache_path()}")
     print(f"Versions to clear: {', '.join(target_versions)}")
 
-    overall = 0
-    for v in target_versions:
-        rc = clear_version(v, args.dry_run, args.force)
-        if rc != 0:
-            overall = rc
+    targets = collect_targets(target_versions)
+    overall = remove_targets(targets, args.dry_run, args.force)
 
     if overall == 0 and not args.dry_run:
         print("\nDone. Reinstall the plugin to pull fresh files:")
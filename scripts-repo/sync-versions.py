@@ -47,12 +47,16 @@ Examples:
 """
 
 import argparse
-import datetime
+import functools
 import re
-import subprocess
 import sys
 from pathlib import Path
 
+# subprocess and datetime are imported inside the functions that need
+# them: this script runs from pre-commit on every commit, and paths like
+# `--check --no-git-ver` never fork a process, so keeping the imports off
+# module startup trims the hot path.
+
 
 # --- Project-specific config ---
 # These values are auto-detected from pyproject.toml [tool.repokit-common]
@@ -116,15 +120,48 @@ VERSION_SOURCE, CHANGELOG_FILE, REPO_URL, TAG_PREFIX, TAG_FORMAT, EXTRA_TARGETS
 # --------------------------------------------------------------------
 
 
+# ---------------------------------------------------------------------------
+# Compiled patterns
+# ---------------------------------------------------------------------------
+# Every static pattern is compiled once at import. The script runs from
+# git hooks on every commit, so per-call re-cache lookups (and their
+# bytecode) are pure overhead on a startup-dominated path. Patterns built
+# from runtime values (re.escape of versions/fields) stay at call sites.
+
+# version.py line keys -> component-dict names, shared by the read scan
+# in read_version_components (the write side keys off components directly)
+_COMPONENT_KEYS = {
+    "MAJOR": "major",
+    "MINOR": "minor",
+    "PATCH": "patch",
+    "PRE_RELEASE_NUM": "pre_num",
+    "PHASE": "phase",
+    "PROJECT_PHASE": "project_phase",
+}
+
+_RE_DUNDER_VERSION = re.compile(r'__version__\s*=\s*"([^"]+)"')
+_RE_DUNDER_VERSION_SUB = re.compile(r'(__version__\s*=\s*")[^"]+(")')
+_RE_XYZ = re.compile(r"^(\d+)\.(\d+)\.(\d+)$")
+_RE_COMPARE_FROM = re.compile(r"compare/([^.]+(?:\.[^.]+)*)\.\.\.")
+_RE_UNRELEASED_LINK = re.compile(r"^\[Unreleased\]:.*$", re.MULTILINE)
+_RE_FIRST_VERSION_LINK = re.compile(r"^\[[\d.]+", re.MULTILINE)
+
+
 # ---------------------------------------------------------------------------
 # Project root
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
 def find_project_root() -> Path:
-    """Find project root by looking for the version source file."""
+    """Find project root by looking for the version source file.
+
+    Memoized: the answer can't change within one run, so repeat callers
+    skip the stat probes (and the git-root subprocess fallback).
+    """
     if Path(VERSION_SOURCE).exists():
         return Path.cwd()
     # Try git root
+    import subprocess
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],
@@ -142,88 +179,122 @@ def find_project_root() -> Path:
 # Version component read/write
 # ---------------------------------------------------------------------------
 
-def read_version_components(file_path: Path) -> dict:
-    """Read MAJOR, MINOR, PATCH, PHASE, PRE_RELEASE_NUM, PROJECT_PHASE."""
-    content = file_path.read_text(encoding="utf-8")
+def read_version_components(file_path: Path, content: str) -> dict:
+    """Read MAJOR, MINOR, PATCH, PHASE, PRE_RELEASE_NUM, PROJECT_PHASE.
 
-    major = re.search(r"^MAJOR\s*=\s*(\d+)", content, re.MULTILINE)
-    minor = re.search(r"^MINOR\s*=\s*(\d+)", content, re.MULTILINE)
-    patch = re.search(r"^PATCH\s*=\s*(\d+)", content, re.MULTILINE)
+    `content` is the already-loaded text of `file_path`; the path is only
+    used for error messages. main() reads the version source exactly once
+    and threads the buffer through every read/apply step.
+    """
+    # Single forward line scan, mirroring apply_version_components: the
+    # `KEY = value` grammar needs no regex engine at all. First
+    # occurrence wins per key, lines with the key indented off column 0
+    # don't match (head keeps its leading whitespace), and the scan
+    # short-circuits once all six keys are bound.
+    found: dict[str, str] = {}
+    for line in content.split("\n"):
+        head, sep, rest = line.partition("=")
+        if not sep:
+            continue
+        key = head.rstrip()
+        if key not in _COMPONENT_KEYS or _COMPONENT_KEYS[key] in found:
+            continue
+        name = _COMPONENT_KEYS[key]
+        value = rest.lstrip()
+        if name in ("major", "minor", "patch", "pre_num"):
+            # leading digit run only, like the old (\d+) capture
+            j = 0
+            while j < len(value) and value[j].isdigit():
+                j += 1
+            if j == 0:
+                continue
+            found[name] = value[:j]
+        elif name == "project_phase":
+            # quoted string required, like the old "([^"]*)" capture
+            if value.startswith('"'):
+                end = value.find('"', 1)
+                if end >= 0:
+                    found[name] = value[1:end]
+        elif value:  # phase: the old (.+) needed at least one char
+            found[name] = value
+        if len(found) == 6:
+            break
 
-    if not all([major, minor, patch]):
+    if not ("major" in found and "minor" in found and "patch" in found):
         raise ValueError(f"Could not parse MAJOR, MINOR, PATCH from {file_path}")
 
-    # PHASE: extract, strip comments and quotes, normalize empty/None
-    phase_match = re.search(r"^PHASE\s*=\s*(.+)$", content, re.MULTILINE)
+    # PHASE: strip comments and quotes, normalize empty/None.
+    # Comment stripping is a plain partition -- no regex needed to drop
+    # everything after the first '#'.
     phase = None
-    if phase_match:
-        raw = phase_match.group(1).strip()
-        raw = re.sub(r"#.*$", "", raw).strip()
-        raw = raw.strip("\"'")
+    raw = found.get("phase")
+    if raw is not None:
+        raw = raw.partition("#")[0].strip().strip("\"'")
         if raw and raw.lower() not in ("none", "null", ""):
             phase = raw
 
-    # PRE_RELEASE_NUM
-    pre_num_match = re.search(r"^PRE_RELEASE_NUM\s*=\s*(\d+)", content, re.MULTILINE)
-    pre_release_num = int(pre_num_match.group(1)) if pre_num_match else 1
-
-    # PROJECT_PHASE (read-only)
-    proj_phase_match = re.search(r'^PROJECT_PHASE\s*=\s*"([^"]*)"', content, re.MULTILINE)
-    project_phase = proj_phase_match.group(1) if proj_phase_match else None
-
     return {
-        "major": int(major.group(1)),
-        "minor": int(minor.group(1)),
-        "patch": int(patch.group(1)),
+        "major": int(found["major"]),
+        "minor": int(found["minor"]),
+        "patch": int(found["patch"]),
         "phase": phase,
-        "pre_release_num": pre_release_num,
-        "project_phase": project_phase,
+        "pre_release_num": int(found["pre_num"]) if "pre_num" in found else 1,
+        "project_phase": found.get("project_phase"),
     }
 
 
-def write_version_components(
-    file_path: Path, components: dict, dry_run: bool = False
-) -> bool:
-    """Update MAJOR, MINOR, PATCH, PHASE, PRE_RELEASE_NUM in version file."""
-    content = file_path.read_text(encoding="utf-8")
-    original = content
+def apply_version_components(content: str, components: dict) -> tuple[str, bool]:
+    """Update MAJOR, MINOR, PATCH, PHASE, PRE_RELEASE_NUM in version content.
 
-    content = re.sub(
-        r"^(MAJOR\s*=\s*)\d+",
-        f"\\g<1>{components['major']}",
-        content, flags=re.MULTILINE,
-    )
-    content = re.sub(
-        r"^(MINOR\s*=\s*)\d+",
-        f"\\g<1>{components['minor']}",
-        content, flags=re.MULTILINE,
-    )
-    content = re.sub(
-        r"^(PATCH\s*=\s*)\d+",
-        f"\\g<1>{components['patch']}",
-        content, flags=re.MULTILINE,
-    )
-
-    # PHASE: write as quoted string or empty string
+    Pure string transform: returns `(new_content, changed)` and leaves the
+    write (or dry-run skip) to the caller, so the file is never re-read and
+    unchanged content never touches disk.
+    """
+    # PHASE: written as quoted string or empty string
     phase_str = f'"{components["phase"]}"' if components["phase"] else '""'
-    content = re.sub(
-        r'^(PHASE\s*=\s*).*$',
-        f"\\g<1>{phase_str}  # Per-MINOR feature set: None, \"alpha\", \"beta\", \"rc1\", etc.",
-        content, flags=re.MULTILINE,
-    )
+    values = {
+        "MAJOR": components["major"],
+        "MINOR": components["minor"],
+        "PATCH": components["patch"],
+        "PRE_RELEASE_NUM": components["pre_release_num"],
+    }
 
-    # PRE_RELEASE_NUM
-    content = re.sub(
-        r"^(PRE_RELEASE_NUM\s*=\s*)\d+",
-        f"\\g<1>{components['pre_release_num']}",
-        content, flags=re.MULTILINE,
-    )
+    # The grammar here is trivial -- `KEY = value` at column 0 -- so a
+    # line-based rewrite beats running the regex engine at all: split
+    # once, patch the matching lines in place, join once. Numeric keys
+    # keep everything after the digits (trailing comments); PHASE
+    # rewrites the remainder of its line, as before. Tracking changes
+    # per line also spares the final full-content compare.
+    lines = content.split("\n")
+    changed = False
+    for i, line in enumerate(lines):
+        head, sep, rest = line.partition("=")
+        if not sep:
+            continue
+        # rstrip only: a key indented off column 0 never matched the old
+        # ^-anchored patterns and must not match now.
+        key = head.rstrip()
+        pad = rest[: len(rest) - len(rest.lstrip())]
+        body = rest[len(pad):]
+        if key in values:
+            j = 0
+            while j < len(body) and body[j].isdigit():
+                j += 1
+            if j == 0:
+                continue  # not a bare numeric assignment; never matched before
+            new_line = f"{head}={pad}{values[key]}{body[j:]}"
+        elif key == "PHASE":
+            new_line = (
+                f"{head}={pad}{phase_str}"
+                '  # Per-MINOR feature set: None, "alpha", "beta", "rc1", etc.'
+            )
+        else:
+            continue
+        if new_line != line:
+            lines[i] = new_line
+            changed = True
 
-    if content != original:
-        if not dry_run:
-            file_path.write_text(content, encoding="utf-8")
-        return True
-    return False
+    return "\n".join(lines), changed
 
 
 # ---------------------------------------------------------------------------
@@ -232,6 +303,9 @@ def write_version_components(
 
 def get_git_info(root: Path, auto_mode: bool = False) -> dict:
     """Gather git metadata for the __version__ string."""
+    import datetime
+    import subprocess
+
     info = {
         "branch": "unknown",
         "build_count": "0",
@@ -239,10 +313,14 @@ def get_git_info(root: Path, auto_mode: bool = False) -> dict:
         "commit_hash": "unknown0",
     }
 
+    # Only the exit status matters for this probe (and for git_stage
+    # below) -- DEVNULL skips allocating pipes and buffering output that
+    # would be thrown away.
     try:
         subprocess.run(
             ["git", "rev-parse", "--git-dir"],
-            cwd=str(root), capture_output=True, check=True,
+            cwd=str(root), stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL, check=True,
         )
     except (subprocess.CalledProcessError, FileNotFoundError):
         return info
@@ -327,31 +405,23 @@ def build_version_string(components: dict, git_info: dict) -> str:
     )
 
 
-def read_version_string(file_path: Path) -> str | None:
-    """Read the current __version__ value from a file."""
-    content = file_path.read_text(encoding="utf-8")
-    match = re.search(r'__version__\s*=\s*"([^"]+)"', content)
+def read_version_string(content: str) -> str | None:
+    """Read the current __version__ value from already-loaded content."""
+    match = _RE_DUNDER_VERSION.search(content)
     return match.group(1) if match else None
 
 
-def write_version_string(
-    file_path: Path, new_version: str, dry_run: bool = False
-) -> bool:
-    """Update the __version__ string in a file."""
-    content = file_path.read_text(encoding="utf-8")
-    original = content
+def apply_version_string(content: str, new_version: str) -> tuple[str, bool]:
+    """Update the __version__ string; returns `(new_content, changed)`.
 
-    content = re.sub(
-        r'(__version__\s*=\s*")[^"]+(")',
-        f"\\g<1>{new_version}\\g<2>",
-        content,
+    subn's match count answers "changed?" directly, sparing the full
+    O(n) compare against the original (callers only reach here when the
+    parsed version already differs, so a match implies a real change).
+    """
+    content, n = _RE_DUNDER_VERSION_SUB.subn(
+        f"\\g<1>{new_version}\\g<2>", content
     )
-
-    if content != original:
-        if not dry_run:
-            file_path.write_text(content, encoding="utf-8")
-        return True
-    return False
+    return content, n > 0
 
 
 # ---------------------------------------------------------------------------
@@ -441,7 +511,7 @@ def demote_version(components: dict, part: str) -> dict:
 
 def parse_version_string(version_str: str) -> tuple[int, int, int]:
     """Parse 'X.Y.Z' into (major, minor, patch)."""
-    match = re.match(r"^(\d+)\.(\d+)\.(\d+)$", version_str.strip())
+    match = _RE_XYZ.match(version_str.strip())
     if not match:
         raise ValueError(
             f"Invalid version format: '{version_str}'. Expected X.Y.Z (e.g., 0.3.0)"
@@ -453,34 +523,31 @@ def parse_version_string(version_str: str) -> tuple[int, int, int]:
 # CHANGELOG management
 # ---------------------------------------------------------------------------
 
-def check_changelog_header(root: Path, version_str: str) -> bool:
-    """Check if CHANGELOG.md has a section header for this version."""
-    changelog = root / CHANGELOG_FILE
-    if not changelog.exists():
-        return False
-    content = changelog.read_text(encoding="utf-8")
-    pattern = rf"##\s*\[{re.escape(version_str)}\]"
-    return bool(re.search(pattern, content))
+def check_changelog_header(content: str, version_str: str) -> bool:
+    """Check if changelog content has a section header for this version."""
+    # Substring membership (memmem in CPython) finds the two real-world
+    # spacings far faster than building and running a regex per call;
+    # the pattern survives only as a fallback for exotic whitespace
+    # between '##' and the bracket.
+    if f"## [{version_str}]" in content or f"##[{version_str}]" in content:
+        return True
+    return bool(re.search(rf"##\s*\[{re.escape(version_str)}\]", content))
 
 
-def update_changelog_links(
-    root: Path, components: dict, dry_run: bool = False
-) -> bool:
-    """Update or add compare links at the bottom of CHANGELOG.md.
+def update_changelog_links(content: str, components: dict) -> tuple[str, bool]:
+    """Update or add compare links at the bottom of changelog content.
 
     Manages two things:
     1. The link for the current version (compare from previous tag)
     2. The [Unreleased] link (compare from current tag to HEAD)
 
     Only touches the link-reference block at the bottom of the file.
-    Never modifies section headers or content.
+    Never modifies section headers or content. Pure string transform:
+    returns `(new_content, changed)`; main() owns the single read/write.
+    Change tracking is per edit -- each mutation is already guarded by an
+    is-it-different test, so no final full-content compare is needed.
     """
-    changelog = root / CHANGELOG_FILE
-    if not changelog.exists():
-        return False
-
-    content = changelog.read_text(encoding="utf-8")
-    original = content
+    changed = False
 
     human_ver = format_human_version(components)
     tag = to_tag(components)
@@ -494,7 +561,7 @@ def update_changelog_links(
         # Link exists -- update it with correct tags
         old_line = link_match.group(0)
         # Extract the "from" tag from the existing compare URL
-        compare_match = re.search(r"compare/([^.]+(?:\.[^.]+)*)\.\.\.", old_line)
+        compare_match = _RE_COMPARE_FROM.search(old_line)
         from_tag = compare_match.group(1) if compare_match else None
         if from_tag:
             new_line = f"[{human_ver}]: {REPO_URL}/compare/{from_tag}...{tag}"
@@ -504,33 +571,71 @@ def update_changelog_links(
 
         if old_line != new_line:
             content = content.replace(old_line, new_line)
+            changed = True
 
     # Update [Unreleased] link to point from current tag to HEAD
-    unreleased_pattern = r"^\[Unreleased\]:.*$"
-    unreleased_match = re.search(unreleased_pattern, content, re.MULTILINE)
+    unreleased_match = _RE_UNRELEASED_LINK.search(content)
     unreleased_line = f"[Unreleased]: {REPO_URL}/compare/{tag}...HEAD"
 
     if unreleased_match:
-        content = re.sub(
-            unreleased_pattern, unreleased_line, content, flags=re.MULTILINE
-        )
+        # Skip the sub (and the change it would fake) when the line is
+        # already exactly right
+        if unreleased_match.group(0) != unreleased_line:
+            content = _RE_UNRELEASED_LINK.sub(unreleased_line, content)
+            changed = True
     else:
         # Add [Unreleased] link before the first version link
-        first_link = re.search(r"^\[[\d.]+", content, re.MULTILINE)
+        first_link = _RE_FIRST_VERSION_LINK.search(content)
         if first_link:
             content = content[:first_link.start()] + unreleased_line + "\n" + content[first_link.start():]
+            changed = True
 
-    if content != original:
-        if not dry_run:
-            changelog.write_text(content, encoding="utf-8")
-        return True
-    return False
+    return content, changed
 
 
 # ---------------------------------------------------------------------------
 # Extra-target version sync (project-specific files via pyproject.toml)
 # ---------------------------------------------------------------------------
 
+def _find_field_spans(content: str, field: str) -> list[tuple[int, int]]:
+    """Locate the value spans of every `"field": "value"` occurrence.
+
+    A str.find scan replaces the old regex pass: for the tiny, well-formed
+    JSON targets this touches each byte once with no engine startup, and
+    both the update and check paths share the result. Returns (start, end)
+    slices covering each non-empty value (quotes excluded), in document
+    order -- the same occurrences the previous `"field"\\s*:\\s*"[^"]+"`
+    pattern matched.
+    """
+    needle = f'"{field}"'
+    spans = []
+    pos = 0
+    n = len(content)
+    while True:
+        i = content.find(needle, pos)
+        if i < 0:
+            break
+        j = i + len(needle)
+        while j < n and content[j] in " \t\r\n":
+            j += 1
+        if j >= n or content[j] != ":":
+            pos = j
+            continue
+        j += 1
+        while j < n and content[j] in " \t\r\n":
+            j += 1
+        if j >= n or content[j] != '"':
+            pos = j
+            continue
+        end = content.find('"', j + 1)
+        if end < 0:
+            break
+        if end > j + 1:  # the regex required a non-empty value; keep that
+            spans.append((j + 1, end))
+        pos = end + 1
+    return spans
+
+
 def update_extra_target(
     target_spec: dict, new_version: str, root: Path, dry_run: bool = False
 ) -> tuple[bool, str]:
@@ -549,8 +654,12 @@ def update_extra_target(
     if not rel_path:
         return False, "extra-target missing 'path' field"
 
+    # EAFP: the read itself answers the existence question, instead of a
+    # stat probe followed by a second open of the same path.
     target_path = root / rel_path
-    if not target_path.exists():
+    try:
+        content = target_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return False, f"file not found: {rel_path}"
 
     target_type = target_spec.get("type", "json")
@@ -562,24 +671,25 @@ def update_extra_target(
     if match_mode not in ("first", "all"):
         return False, f"match must be 'first' or 'all', got '{match_mode}'"
 
-    content = target_path.read_text(encoding="utf-8")
-    original = content
-
-    # Match "field": "value" with whitespace tolerance; preserve quote style.
-    pattern = rf'("{re.escape(field)}"\s*:\s*")[^"]+(")'
-    count = 0 if match_mode == "all" else 1
-    content = re.sub(
-        pattern,
-        lambda m: f"{m.group(1)}{new_version}{m.group(2)}",
-        content,
-        count=count,
-    )
+    # Splice the new version into the found spans; everything outside them
+    # is copied verbatim, so formatting and quote style are preserved.
+    spans = _find_field_spans(content, field)
+    if match_mode == "first":
+        spans = spans[:1]
 
-    if content == original:
+    if not spans or all(content[s:e] == new_version for s, e in spans):
         return False, "already in sync (or pattern not found)"
 
+    out = []
+    last = 0
+    for s, e in spans:
+        out.append(content[last:s])
+        out.append(new_version)
+        last = e
+    out.append(content[last:])
+
     if not dry_run:
-        target_path.write_text(content, encoding="utf-8")
+        target_path.write_text("".join(out), encoding="utf-8")
     return True, "updated"
 
 
@@ -593,13 +703,13 @@ def check_extra_target(target_spec: dict, expected_version: str, root: Path) ->
         return False, "extra-target missing 'path' field"
 
     target_path = root / rel_path
-    if not target_path.exists():
+    try:
+        content = target_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return False, f"file not found: {rel_path}"
 
     field = target_spec.get("field", "version")
-    content = target_path.read_text(encoding="utf-8")
-    pattern = rf'"{re.escape(field)}"\s*:\s*"([^"]+)"'
-    matches = re.findall(pattern, content)
+    matches = [content[s:e] for s, e in _find_field_spans(content, field)]
     if not matches:
         return False, f"no '{field}' field found"
 
@@ -612,12 +722,62 @@ def check_extra_target(target_spec: dict, expected_version: str, root: Path) ->
     )
 
 
+# ---------------------------------------------------------------------------
+# Check cache (--check fast path)
+# ---------------------------------------------------------------------------
+# After a verified-in-sync state (clean --check, or a sync that brought
+# everything up to date), record each tracked file's (mtime_ns, size)
+# plus the version it was verified against in .sync-versions.cache. On
+# the next --check, targets whose signature still matches are trusted
+# without re-reading -- "only re-hash what changed". The git-derived
+# __version__ check is deliberately NOT cached: its inputs (branch,
+# commit count, date) move independently of any file mtime.
+
+_CHECK_CACHE_NAME = ".sync-versions.cache"
+
+
+def _stat_sig(path: Path) -> list | None:
+    """(mtime_ns, size) signature, or None when the file is missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _load_check_cache(root: Path) -> dict:
+    import json
+    try:
+        data = json.loads((root / _CHECK_CACHE_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_check_cache(root: Path, version: str, rel_paths: list[str]) -> None:
+    """Best-effort: a failed write just means no fast path next time."""
+    import json
+    files = {}
+    for rel in rel_paths:
+        sig = _stat_sig(root / rel)
+        if sig is not None:
+            files[rel] = sig
+    try:
+        (root / _CHECK_CACHE_NAME).write_text(
+            json.dumps({"version": version, "files": files}, indent=2) + "\n",
+            encoding="utf-8",
+        )
+    except OSError:
+        pass
+
+
 # ---------------------------------------------------------------------------
 # Git helpers
 # ---------------------------------------------------------------------------
 
 def git_tag_exists(root: Path, tag: str) -> bool:
     """Check if a git tag exists in the repository."""
+    import subprocess
     try:
         result = subprocess.run(
             ["git", "tag", "-l", tag],
@@ -630,10 +790,12 @@ def git_tag_exists(root: Path, tag: str) -> bool:
 
 def git_stage(root: Path, *files: str) -> None:
     """Stage files for commit."""
+    import subprocess
     try:
         subprocess.run(
             ["git", "add"] + list(files),
-            cwd=str(root), capture_output=True, check=True,
+            cwd=str(root), stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL, check=True,
         )
     except (subprocess.CalledProcessError, FileNotFoundError):
         pass
@@ -643,6 +805,30 @@ def git_stage(root: Path, *files: str) -> None:
 # Main
 # ---------------------------------------------------------------------------
 
+def _confirm(warning: str, skip: bool) -> bool:
+    """Prompt for an explicit 'yes' before a destructive version change.
+
+    Returns True when the change may proceed. `skip` (precomputed from
+    --force/--dry-run/--check) short-circuits without touching the TTY.
+    A non-interactive stdin aborts immediately instead of blocking a CI
+    runner on input() -- and never silently approves a major change.
+    """
+    if skip:
+        return True
+    print(f"\n  {warning}")
+    if not sys.stdin.isatty():
+        print("  Aborted: stdin is not a TTY (use --force to confirm non-interactively).")
+        return False
+    try:
+        if input("\n  Type 'yes' to confirm: ").lower() != "yes":
+            print("  Aborted.")
+            return False
+    except (EOFError, KeyboardInterrupt):
+        print("\n  Aborted.")
+        return False
+    return True
+
+
 def main():
     parser = argparse.ArgumentParser(
         description=f"Sync versions across {Path(VERSION_SOURCE).parent.name} project files"
@@ -685,6 +871,8 @@ def main():
     args = parser.parse_args()
 
     quiet = args.auto
+    # Computed once; every confirmation gate shares the same skip rules.
+    skip_confirm = args.force or args.dry_run or args.check
 
     try:
         root = find_project_root()
@@ -692,8 +880,12 @@ def main():
         print(f"Error: {e}", file=sys.stderr)
         return 1
 
-    # Read current version from source of truth
-    components = read_version_components(root / VERSION_SOURCE)
+    # Read current version from source of truth -- exactly once. Every
+    # later read/apply step works against this buffer; re-reading the file
+    # between phases was pure duplicate syscall traffic.
+    ver_path = root / VERSION_SOURCE
+    ver_content = ver_path.read_text(encoding="utf-8")
+    components = read_version_components(ver_path, ver_content)
     current_version = format_human_version(components)
     components_changed = False
 
@@ -720,9 +912,9 @@ def main():
         components["pre_release_num"] = args.pre_num
         components_changed = True
 
-    # Handle --set, --bump, or --demote (mutually exclusive)
-    version_ops = [args.set, args.bump, args.demote]
-    if sum(1 for op in version_ops if op) > 1:
+    # Handle --set, --bump, or --demote (mutually exclusive) -- three
+    # booleans don't need a generator frame to count
+    if bool(args.set) + bool(args.bump) + bool(args.demote) > 1:
         print("Error: Cannot use --set, --bump, and --demote together", file=sys.stderr)
         return 1
 
@@ -739,16 +931,11 @@ def main():
 
         new_version = format_human_version(components)
 
-        if new_major != components["major"] and not args.force and not args.dry_run and not args.check:
-            print(f"\n  WARNING: Major version change: {current_version} -> {new_version}")
-            try:
-                confirm = input("\n  Type 'yes' to confirm: ")
-                if confirm.lower() != "yes":
-                    print("  Aborted.")
-                    return 1
-            except (EOFError, KeyboardInterrupt):
-                print("\n  Aborted.")
-                return 1
+        if new_major != components["major"] and not _confirm(
+            f"WARNING: Major version change: {current_version} -> {new_version}",
+            skip_confirm,
+        ):
+            return 1
 
         if not quiet:
             print(f"Setting version: {current_version} -> {new_version}")
@@ -758,16 +945,11 @@ def main():
         new_components = bump_version(components, args.bump)
         new_version = format_human_version(new_components)
 
-        if args.bump == "major" and not args.force and not args.dry_run and not args.check:
-            print(f"\n  WARNING: Major version bump: {current_version} -> {new_version}")
-            try:
-                confirm = input("\n  Type 'yes' to confirm: ")
-                if confirm.lower() != "yes":
-                    print("  Aborted.")
-                    return 1
-            except (EOFError, KeyboardInterrupt):
-                print("\n  Aborted.")
-                return 1
+        if args.bump == "major" and not _confirm(
+            f"WARNING: Major version bump: {current_version} -> {new_version}",
+            skip_confirm,
+        ):
+            return 1
 
         if not quiet:
             print(f"Bumping {args.bump}: {current_version} -> {new_version}")
@@ -805,10 +987,24 @@ def main():
     all_synced = True
     files_updated = []
 
+    # --check fast path: load signatures from the last verified-in-sync
+    # state. Only valid when that state was for this same version.
+    if args.check:
+        _cache = _load_check_cache(root)
+        cache_files = (
+            _cache.get("files", {})
+            if _cache.get("version") == current_version else {}
+        )
+    else:
+        cache_files = {}
+
     # --- Write components if changed ---
     if components_changed and not args.check:
-        updated = write_version_components(root / VERSION_SOURCE, components, args.dry_run)
+        new_content, updated = apply_version_components(ver_content, components)
         if updated:
+            if not args.dry_run:
+                ver_path.write_text(new_content, encoding="utf-8")
+                ver_content = new_content
             action = "would update" if args.dry_run else "updated"
             if not quiet:
                 print(f"  [OK] {VERSION_SOURCE}: components {action}")
@@ -819,8 +1015,7 @@ def main():
         git_info = get_git_info(root, auto_mode=args.auto)
         new_ver_string = build_version_string(components, git_info)
 
-        ver_path = root / VERSION_SOURCE
-        current_str = read_version_string(ver_path)
+        current_str = read_version_string(ver_content)
 
         if current_str != new_ver_string:
             all_synced = False
@@ -830,8 +1025,11 @@ def main():
                     print(f"       current:  {current_str}")
                     print(f"       expected: {new_ver_string}")
             else:
-                updated = write_version_string(ver_path, new_ver_string, args.dry_run)
+                new_content, updated = apply_version_string(ver_content, new_ver_string)
                 if updated:
+                    if not args.dry_run:
+                        ver_path.write_text(new_content, encoding="utf-8")
+                        ver_content = new_content
                     action = "would update" if args.dry_run else "updated"
                     if not quiet:
                         print(f"  [OK] {VERSION_SOURCE}: __version__ {action}")
@@ -845,19 +1043,40 @@ def main():
     # Strictly additive: if EXTRA_TARGETS is empty (no config), this loop is a
     # no-op and behavior is identical to upstream-pristine sync-versions.py.
     if EXTRA_TARGETS:
-        for target_spec in EXTRA_TARGETS:
+        # Each target is an independent read-(modify-write|check) cycle, so
+        # overlap the I/O across a small thread pool when there is more
+        # than one -- same move as install.py's parallel copies. Results
+        # come back in config order, and all printing/accounting happens
+        # serially afterwards, so output stays deterministic.
+        def _process_target(target_spec: dict) -> tuple[bool, str]:
+            if args.check:
+                rel = target_spec.get("path")
+                if rel:
+                    sig = cache_files.get(rel)
+                    if sig is not None and sig == _stat_sig(root / rel):
+                        return True, "unchanged since last verified sync (cached)"
+                return check_extra_target(target_spec, current_version, root)
+            return update_extra_target(
+                target_spec, current_version, root, args.dry_run
+            )
+
+        if len(EXTRA_TARGETS) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(4, len(EXTRA_TARGETS))) as ex:
+                results = list(ex.map(_process_target, EXTRA_TARGETS))
+        else:
+            results = [_process_target(EXTRA_TARGETS[0])]
+
+        for target_spec, (flag, msg) in zip(EXTRA_TARGETS, results):
             label = target_spec.get("path", "<missing-path>")
             if args.check:
-                in_sync, msg = check_extra_target(target_spec, current_version, root)
-                if not in_sync:
+                if not flag:
                     all_synced = False
                     print(f"  [X] {label}: {msg}")
                 elif args.verbose:
                     print(f"  [OK] {label}: {msg}")
             else:
-                modified, msg = update_extra_target(
-                    target_spec, current_version, root, args.dry_run
-                )
+                modified = flag
                 if modified:
                     action = "would update" if args.dry_run else "updated"
                     if not quiet:
@@ -871,10 +1090,29 @@ def main():
                     print(f"  [OK] {label}: {msg}")
 
     # --- Sync CHANGELOG.md compare links ---
+    # One read serves the header check, the link update, and (in check
+    # mode) the link verification; the open doubles as the existence probe.
     changelog_path = root / CHANGELOG_FILE
-    if changelog_path.exists():
+    changelog_sig = cache_files.get(CHANGELOG_FILE)
+    changelog_cached = (
+        args.check
+        and changelog_sig is not None
+        and changelog_sig == _stat_sig(changelog_path)
+    )
+    if changelog_cached:
+        changelog_content = None
+    else:
+        try:
+            changelog_content = changelog_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            changelog_content = None
+
+    if changelog_cached:
+        if args.verbose:
+            print(f"  [OK] {CHANGELOG_FILE}: unchanged since last verified sync (cached)")
+    elif changelog_content is not None:
         # Check header
-        has_header = check_changelog_header(root, current_version)
+        has_header = check_changelog_header(changelog_content, current_version)
         if not has_header:
             all_synced = False
             if args.check:
@@ -884,15 +1122,17 @@ def main():
 
         # Update compare links
         if not args.check:
-            updated = update_changelog_links(root, components, args.dry_run)
+            new_changelog, updated = update_changelog_links(changelog_content, components)
             if updated:
+                if not args.dry_run:
+                    changelog_path.write_text(new_changelog, encoding="utf-8")
                 action = "would update" if args.dry_run else "updated"
                 if not quiet:
                     print(f"  [OK] {CHANGELOG_FILE}: compare links {action}")
                 files_updated.append(CHANGELOG_FILE)
         else:
             # In check mode, verify the current version's link has the right tag
-            content = changelog_path.read_text(encoding="utf-8")
+            content = changelog_content
             human_ver = format_human_version(components)
             # Check that the link ends with the correct tag (not a substring like v0.2.3a1 matching v0.2.3)
             link_pattern = rf"^\[{re.escape(human_ver)}\]:.*\.\.\.{re.escape(tag)}$"
@@ -918,6 +1158,16 @@ def main():
     if args.auto and files_updated and not args.dry_run:
         git_stage(root, *files_updated)
 
+    # Persist the fast-path cache whenever this run ends in a verified
+    # in-sync state (never on dry runs -- disk may not match).
+    if all_synced and not args.dry_run:
+        _write_check_cache(
+            root,
+            current_version,
+            [CHANGELOG_FILE]
+            + [t.get("path") for t in EXTRA_TARGETS if t.get("path")],
+        )
+
     # Summary
     if args.check:
         if all_synced:
@@ -0,0 +1,154 @@
+"""Deferred sidecar writes — queueing, coalescing, and exit flush.
+
+Covers `cclogger/deferred_writes`, the atexit-flushed persistence layer
+behind the session-state JSON, name-cache, and run-marker sidecars.
+
+Test classes:
+  * QueueAndCoalesce — defer_write queues, later payloads for the same
+                       path replace earlier ones, flush drains the queue
+  * SkipIfIdentical — payloads matching on-disk bytes are not rewritten
+  * BestEffortFlush — one failing path never blocks the others, no .tmp
+                      files survive a successful flush
+  * FlushAtExit — payloads deferred in a subprocess land on disk when
+                  the interpreter exits normally
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from cclogger import deferred_writes
+from cclogger.deferred_writes import defer_write, flush_pending_writes
+
+
+@pytest.fixture(autouse=True)
+def clean_pending_queue():
+    """Empty the module-level queue around each test.
+
+    The queue is process-global state; a payload left behind by one test
+    would be flushed (or coalesced over) by the next.
+    """
+    deferred_writes._pending_writes.clear()
+    yield
+    deferred_writes._pending_writes.clear()
+
+
+# ============================================================================
+# QueueAndCoalesce
+# ============================================================================
+
+
+class TestQueueAndCoalesce:
+    def test_defer_write_does_not_touch_disk(self, tmp_path):
+        target = tmp_path / "state.json"
+        defer_write(target, b'{"run": 1}')
+        assert not target.exists()
+
+    def test_flush_writes_queued_payload(self, tmp_path):
+        target = tmp_path / "state.json"
+        defer_write(target, b'{"run": 1}')
+        flush_pending_writes()
+        assert target.read_bytes() == b'{"run": 1}'
+
+    def test_later_payload_replaces_earlier_for_same_path(self, tmp_path):
+        target = tmp_path / "state.json"
+        defer_write(target, b'{"run": 1}')
+        defer_write(target, b'{"run": 2}')
+        defer_write(target, b'{"run": 3}')
+        assert len(deferred_writes._pending_writes) == 1
+        flush_pending_writes()
+        assert target.read_bytes() == b'{"run": 3}'
+
+    def test_distinct_paths_all_flushed(self, tmp_path):
+        paths = {tmp_path / f"sidecar{i}.json": b"payload %d" % i for i in range(3)}
+        for path, data in paths.items():
+            defer_write(path, data)
+        flush_pending_writes()
+        for path, data in paths.items():
+            assert path.read_bytes() == data
+
+    def test_flush_drains_the_queue(self, tmp_path):
+        defer_write(tmp_path / "state.json", b"x")
+        flush_pending_writes()
+        assert not deferred_writes._pending_writes
+
+    def test_flush_with_empty_queue_is_a_noop(self):
+        flush_pending_writes()  # must not raise
+
+
+# ============================================================================
+# SkipIfIdentical
+# ============================================================================
+
+
+class TestSkipIfIdentical:
+    def test_matching_bytes_leave_file_untouched(self, tmp_path):
+        target = tmp_path / "name.cache"
+        target.write_bytes(b"same payload")
+        old_time = 1_000_000_000
+        os.utime(target, (old_time, old_time))
+        defer_write(target, b"same payload")
+        flush_pending_writes()
+        # The file was never rewritten, so the back-dated mtime survives.
+        assert target.stat().st_mtime == old_time
+        assert target.read_bytes() == b"same payload"
+
+    def test_differing_bytes_are_rewritten(self, tmp_path):
+        target = tmp_path / "name.cache"
+        target.write_bytes(b"old payload")
+        old_time = 1_000_000_000
+        os.utime(target, (old_time, old_time))
+        defer_write(target, b"new payload")
+        flush_pending_writes()
+        assert target.read_bytes() == b"new payload"
+        assert target.stat().st_mtime != old_time
+
+
+# ============================================================================
+# BestEffortFlush
+# ============================================================================
+
+
+class TestBestEffortFlush:
+    def test_failing_path_does_not_block_others(self, tmp_path):
+        good = tmp_path / "good.json"
+        bad = tmp_path / "missing-dir" / "bad.json"  # parent does not exist
+        defer_write(bad, b"never lands")
+        defer_write(good, b"lands fine")
+        flush_pending_writes()  # must not raise
+        assert good.read_bytes() == b"lands fine"
+        assert not bad.exists()
+
+    def test_no_temp_files_survive_flush(self, tmp_path):
+        defer_write(tmp_path / "a.json", b"a")
+        defer_write(tmp_path / "b.json", b"b")
+        flush_pending_writes()
+        leftovers = [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")]
+        assert leftovers == []
+
+
+# ============================================================================
+# FlushAtExit
+# ============================================================================
+
+
+class TestFlushAtExit:
+    def test_deferred_payload_written_on_normal_exit(self, tmp_path):
+        target = tmp_path / "exit.json"
+        script = (
+            "from pathlib import Path\n"
+            "from cclogger.deferred_writes import defer_write\n"
+            f"defer_write(Path({str(target)!r}), b'flushed at exit')\n"
+        )
+        env = dict(os.environ)
+        hooks_scripts = Path(deferred_writes.__file__).resolve().parent.parent
+        env["PYTHONPATH"] = str(hooks_scripts)
+        subprocess.run(
+            [sys.executable, "-c", script], env=env, check=True, timeout=30,
+        )
+        assert target.read_bytes() == b"flushed at exit"